@@ -13,7 +13,9 @@ from services.cache_service import CacheService, schedule_analysis_refresh
 from utils.monitoring import record_request, snapshot_metrics
 from services.usage_analytics import usage_summary
 from services.user_rate_limiter import check_rate_limit
-from services.feature_flags import is_enabled
+from services.feature_flags import is_enabled, refresh_flags
+from services.alerting import reload_thresholds
+from services.http_client import reload_http_config
 import os
 
 api_bp = Blueprint('api', __name__)
@@ -153,17 +155,17 @@ def get_report(symbol):
         data_context = merger.merge_stock_data(symbol, {"financials", "price"})
         full_report = analysis_service.perform_full_analysis(data_context, include_ai=include_ai)
 
-        pdf_bytes = PDFReportBuilder(full_report).build()
-
         date_str = datetime.now().strftime("%Y%m%d")
         filename = f"{symbol.upper()}_Analysis_{date_str}.pdf"
 
-        status = 200
-        return Response(
-            pdf_bytes,
+        response = Response(
             mimetype="application/pdf",
             headers={"Content-Disposition": f"attachment; filename=\"{filename}\""},
         )
+        PDFReportBuilder(full_report).build_to(response.stream)
+
+        status = 200
+        return response
     except Exception as e:
         return brand_error(f"{BRAND_NAME} encountered an error.", str(e)), 500
     finally:
@@ -236,6 +238,17 @@ def clear_cache():
         return jsonify({"message": "Cache cleared successfully"}), 200
     return jsonify({"error": "Cache service not available"}), 500
 
+@api_bp.route('/admin/reload-config', methods=['POST'])
+def reload_config():
+    """
+    Re-reads environment-driven settings (feature flags, alert thresholds,
+    HTTP user agents and proxies) without a restart.
+    """
+    refresh_flags()
+    reload_thresholds()
+    reload_http_config()
+    return jsonify({"message": "Configuration reloaded"}), 200
+
 @api_bp.route('/admin/metrics', methods=['GET'])
 def metrics():
     cache_stats = CacheService().get_stats()
@@ -16,9 +16,11 @@ from flask import Flask
 from flask_cors import CORS
 from api.routes import api_bp
 from services.background_jobs import start_background_jobs
+from utils.json_provider import OrjsonProvider
 
 def create_app():
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     CORS(app)
 
     # Register Blueprints
@@ -1,28 +1,72 @@
-import json
 import os
+import queue
+import threading
 import time
-import urllib.request
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from utils.logging import log
+from utils.monitoring import inc_counter
+
+
+_alert_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(
+    maxsize=int(os.getenv("ALERT_QUEUE_MAX_SIZE", "1000"))
+)
+_sender_thread: Optional[threading.Thread] = None
+_sender_lock = threading.Lock()
 
 
 def _webhook_url() -> str:
     return os.getenv("ALERT_WEBHOOK_URL", "").strip()
 
 
-def _post_webhook(payload: Dict[str, Any]) -> None:
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"POST"}),
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _sender_loop() -> None:
+    session = _build_session()
+    while True:
+        payload = _alert_queue.get()
+        try:
+            _post_webhook(session, payload)
+        finally:
+            _alert_queue.task_done()
+
+
+def _post_webhook(session: requests.Session, payload: Dict[str, Any]) -> None:
     url = _webhook_url()
     if not url:
         return
-    body = json.dumps(payload).encode("utf-8")
-    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
     try:
-        with urllib.request.urlopen(request, timeout=10) as _resp:
-            pass
+        session.post(url, json=payload, timeout=10)
     except Exception as e:
         log(f"Alert webhook failed: {e}")
 
 
+def _ensure_sender() -> None:
+    global _sender_thread
+    if _sender_thread is not None:
+        return
+    with _sender_lock:
+        if _sender_thread is None:
+            _sender_thread = threading.Thread(target=_sender_loop, daemon=True, name="alert-sender")
+            _sender_thread.start()
+
+
 def emit_alert(level: str, message: str, details: Dict[str, Any]) -> None:
     payload = {
         "level": level,
@@ -31,39 +75,64 @@ def emit_alert(level: str, message: str, details: Dict[str, Any]) -> None:
         "timestamp": time.time(),
     }
     log(f"[ALERT][{level}] {message} :: {details}")
-    _post_webhook(payload)
+    if not _webhook_url():
+        return
+    _ensure_sender()
+    try:
+        _alert_queue.put_nowait(payload)
+    except queue.Full:
+        inc_counter("alerts_dropped_total")
+        log("Alert queue full, dropping webhook delivery")
+
+
+def _read_thresholds() -> Tuple[float, int, float]:
+    return (
+        float(os.getenv("ALERT_CACHE_HIT_WARN", "0.7")),
+        int(os.getenv("ALERT_REQUEST_RATE_WARN", "40")),
+        float(os.getenv("ALERT_ERROR_RATE_CRIT", "0.1")),
+    )
+
+
+_CACHE_HIT_WARN, _REQUEST_RATE_WARN, _ERROR_RATE_CRIT = _read_thresholds()
+
+
+def reload_thresholds() -> None:
+    global _CACHE_HIT_WARN, _REQUEST_RATE_WARN, _ERROR_RATE_CRIT
+    _CACHE_HIT_WARN, _REQUEST_RATE_WARN, _ERROR_RATE_CRIT = _read_thresholds()
 
 
-def evaluate_alerts(metrics: Dict[str, Any], cache_stats: Dict[str, Any]) -> List[Dict[str, Any]]:
-    alerts: List[Dict[str, Any]] = []
-    cache_hit_warn = float(os.getenv("ALERT_CACHE_HIT_WARN", "0.7"))
-    req_rate_warn = int(os.getenv("ALERT_REQUEST_RATE_WARN", "40"))
-    error_rate_crit = float(os.getenv("ALERT_ERROR_RATE_CRIT", "0.1"))
+def evaluate_alerts(
+    metrics: Dict[str, Any],
+    cache_stats: Dict[str, Any],
+    out: Optional[List[Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    alerts: List[Dict[str, Any]] = out if out is not None else []
+    alerts.clear()
 
     hit_rate = cache_stats.get("memory", {}).get("hit_rate", 1.0)
-    if hit_rate < cache_hit_warn:
+    if hit_rate < _CACHE_HIT_WARN:
         alerts.append({
             "level": "warning",
             "message": "Cache hit rate below threshold",
-            "details": {"hit_rate": hit_rate, "threshold": cache_hit_warn},
+            "details": {"hit_rate": hit_rate, "threshold": _CACHE_HIT_WARN},
         })
 
     req_per_min = metrics.get("rates", {}).get("requests_per_min", 0)
-    if req_per_min > req_rate_warn:
+    if req_per_min > _REQUEST_RATE_WARN:
         alerts.append({
             "level": "warning",
             "message": "High request rate detected",
-            "details": {"requests_per_min": req_per_min, "threshold": req_rate_warn},
+            "details": {"requests_per_min": req_per_min, "threshold": _REQUEST_RATE_WARN},
         })
 
     total = metrics.get("counters", {}).get("requests_total", 0)
     errors = metrics.get("counters", {}).get("requests_error_total", 0)
     error_rate = (errors / total) if total else 0.0
-    if error_rate > error_rate_crit:
+    if error_rate > _ERROR_RATE_CRIT:
         alerts.append({
             "level": "critical",
             "message": "High error rate detected",
-            "details": {"error_rate": round(error_rate, 3), "threshold": error_rate_crit},
+            "details": {"error_rate": round(error_rate, 3), "threshold": _ERROR_RATE_CRIT},
         })
 
     return alerts
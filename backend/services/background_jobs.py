@@ -1,6 +1,7 @@
 from services.request_scheduler import schedule_task
 from services.health_monitor import start_health_monitor
 from services.maintenance import start_maintenance
+from services.cache_service import warm_refresh_services
 from services.feature_flags import is_enabled
 
 
@@ -14,6 +15,8 @@ def start_background_jobs() -> None:
     _started = True
     # Ensure scheduler thread is initialized
     schedule_task(lambda: None, delay_seconds=0.0, key="noop")
+    # Build the refresh engines off the request path so the first refresh is warm
+    schedule_task(warm_refresh_services, delay_seconds=0.0, key="warm-refresh-services")
     if is_enabled("FEATURE_ALERTS"):
         start_health_monitor()
     if is_enabled("FEATURE_MAINTENANCE"):
@@ -1,11 +1,12 @@
 import redis
 import json
 import os
+import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from functools import wraps
 from flask import request, jsonify
-from utils.api_resilience import APICache
+from utils.api_resilience import ShardedLRU
 from utils.monitoring import record_request
 from services.analysis_include import parse_include_param
 from services.request_scheduler import schedule_task
@@ -21,11 +22,11 @@ from utils.logging import log
 
 _MEMORY_TTL_SECONDS = int(os.getenv("MEMORY_CACHE_TTL_SECONDS", "300"))
 _MEMORY_CACHE_MAX_ENTRIES = int(os.getenv("MEMORY_CACHE_MAX_ENTRIES", "1000"))
-_memory_cache = APICache(
+_MEMORY_CACHE_SHARDS = int(os.getenv("MEMORY_CACHE_SHARDS", "16"))
+_memory_cache = ShardedLRU(
     default_ttl=_MEMORY_TTL_SECONDS,
-    enable_disk=False,
-    enable_memory=True,
     max_entries=_MEMORY_CACHE_MAX_ENTRIES,
+    shards=_MEMORY_CACHE_SHARDS,
 )
 _persistent_cache = PersistentCache()
 
@@ -73,6 +74,20 @@ class CacheService:
         self.client.setex(key, timeout, json.dumps(wrapped))
         _persistent_cache.set(key, wrapped, timeout)
 
+    def set_many(self, items: List[Tuple[str, Any, int]]) -> None:
+        """Store several (key, value, timeout) entries with one Redis round trip and one SQLite transaction."""
+        wrapped_items = []
+        for key, value, timeout in items:
+            wrapped = self._wrap(value, timeout)
+            _memory_cache.set(key, wrapped, ttl=min(_MEMORY_TTL_SECONDS, timeout))
+            wrapped_items.append((key, wrapped, timeout))
+        if self.enabled:
+            pipe = self.client.pipeline(transaction=False)
+            for key, wrapped, timeout in wrapped_items:
+                pipe.setex(key, timeout, json.dumps(wrapped))
+            pipe.execute()
+        _persistent_cache.set_many(wrapped_items)
+
     def get_stats(self) -> Dict[str, Any]:
         memory_stats = _memory_cache.get_stats()
         return {
@@ -91,13 +106,28 @@ class CacheService:
         return value, None, None
 
     def _get_persistent(self, key: str) -> Tuple[Optional[Any], Optional[float], Optional[int]]:
-        persisted = _persistent_cache.get(key)
+        persisted = _persistent_cache.get_with_refresh_hint(key)
         if not persisted:
             return None, None, None
-        value, cached_at, _expires_at = persisted
+        value, cached_at, _expires_at, needs_refresh = persisted
+        if needs_refresh:
+            _schedule_early_refresh(key)
         data, wrapped_at, ttl = self._unwrap(value)
         return data, wrapped_at or cached_at, ttl
 
+_cache_service: Optional[CacheService] = None
+_cache_service_lock = threading.Lock()
+
+
+def get_cache_service() -> CacheService:
+    global _cache_service
+    if _cache_service is None:
+        with _cache_service_lock:
+            if _cache_service is None:
+                _cache_service = CacheService()
+    return _cache_service
+
+
 def cached_stock_data(timeout=3600):
     cache = CacheService()
     stale_ttl = int(os.getenv("ANALYSIS_STALE_TTL_SECONDS", "604800"))
@@ -200,20 +230,61 @@ def cached_stock_data(timeout=3600):
     return decorator
 
 
+_refresh_merger = None
+_refresh_analysis_service = None
+_refresh_cache = None
+_refresh_services_lock = threading.Lock()
+
+
+def _get_refresh_services():
+    global _refresh_merger, _refresh_analysis_service, _refresh_cache
+    if _refresh_cache is None:
+        with _refresh_services_lock:
+            if _refresh_cache is None:
+                from engines.merger import DataMerger
+                from services.analysis_service import AnalysisService
+                _refresh_merger = DataMerger()
+                _refresh_analysis_service = AnalysisService()
+                _refresh_cache = get_cache_service()
+    return _refresh_merger, _refresh_analysis_service, _refresh_cache
+
+
+def warm_refresh_services() -> None:
+    _get_refresh_services()
+
+
+def _compute_analysis(symbol: str, include_set) -> Any:
+    merger, analysis_service, _cache = _get_refresh_services()
+    data_context = merger.merge_stock_data(symbol, include_set)
+    include_ai = os.getenv("REFRESH_INCLUDE_AI", "false").strip().lower() in ("1", "true", "yes")
+    return analysis_service.perform_full_analysis(data_context, include_ai=include_ai)
+
+
 def _refresh_analysis(symbol: str, include_set, cache_key: str, timeout: int) -> None:
     try:
-        from engines.merger import DataMerger
-        from services.analysis_service import AnalysisService
-        merger = DataMerger()
-        analysis_service = AnalysisService()
-        data_context = merger.merge_stock_data(symbol, include_set)
-        include_ai = os.getenv("REFRESH_INCLUDE_AI", "false").strip().lower() in ("1", "true", "yes")
-        full_report = analysis_service.perform_full_analysis(data_context, include_ai=include_ai)
-        CacheService().set(cache_key, full_report, timeout)
+        full_report = _compute_analysis(symbol, include_set)
+        _get_refresh_services()[2].set(cache_key, full_report, timeout)
     except Exception as e:
         log(f"Background refresh failed for {symbol}: {e}")
 
 
+def _refresh_analysis_batch(symbols: List[str], include_param: str, timeout: int) -> None:
+    include_set = parse_include_param(include_param)
+    items = []
+    for symbol in symbols:
+        try:
+            full_report = _compute_analysis(symbol, include_set)
+        except Exception as e:
+            log(f"Background refresh failed for {symbol}: {e}")
+            continue
+        items.append((f"stock_analysis:{symbol}:{include_param}:{timeout}", full_report, timeout))
+    if items:
+        try:
+            _get_refresh_services()[2].set_many(items)
+        except Exception as e:
+            log(f"Background batch cache write failed: {e}")
+
+
 def schedule_analysis_refresh(
     symbol: str,
     include_param: str,
@@ -235,6 +306,51 @@ def schedule_analysis_refresh(
     )
 
 
+def schedule_analysis_refresh_batch(
+    symbols: List[str],
+    include_param: str,
+    timeout: int,
+    delay_seconds: float = 2.0,
+    priority: int = 2,
+) -> bool:
+    """Refresh several symbols in one background task and write them to the cache together."""
+    if not symbols:
+        return False
+    return schedule_task(
+        _refresh_analysis_batch,
+        list(symbols),
+        include_param,
+        timeout,
+        priority=priority,
+        delay_seconds=delay_seconds,
+        key=f"refresh-batch:{include_param}:{timeout}:{','.join(symbols)}",
+    )
+
+
+def _schedule_early_refresh(cache_key: str) -> None:
+    # Only analysis entries know how to rebuild themselves.
+    parts = cache_key.split(":")
+    if len(parts) != 4 or parts[0] != "stock_analysis":
+        return
+    _, symbol, include_param, base_timeout = parts
+    try:
+        base_timeout = int(base_timeout)
+    except ValueError:
+        return
+    # Rewrite the same key with the TTL the request path would have used.
+    include_set = parse_include_param(include_param)
+    schedule_task(
+        _refresh_analysis,
+        symbol,
+        include_set,
+        cache_key,
+        _dynamic_timeout(symbol, include_set, base_timeout),
+        priority=2,
+        delay_seconds=1.0,
+        key=f"refresh:{cache_key}",
+    )
+
+
 def _maybe_schedule_prefetch(
     interval_seconds: int,
     window_seconds: int,
@@ -1,5 +1,6 @@
 import csv
 import os
+import pickle
 from typing import Dict, List, Optional
 
 
@@ -28,6 +29,15 @@ class CompanyRegistry:
             print(f"[CompanyRegistry] CSV not found at {csv_path}")
             return
 
+        cache_path = self._cache_path()
+        cached = self._load_cached(csv_path, cache_path)
+        if cached is not None:
+            companies, symbol_index = cached
+            self.__class__._companies = companies
+            self.__class__._symbol_index = symbol_index
+            print(f"[CompanyRegistry] Loaded {len(companies)} companies (cached)")
+            return
+
         companies = []
         symbol_index = {}
         with open(csv_path, "r", encoding="utf-8") as f:
@@ -50,8 +60,40 @@ class CompanyRegistry:
 
         self.__class__._companies = companies
         self.__class__._symbol_index = symbol_index
+        self._save_cached(cache_path, companies, symbol_index)
         print(f"[CompanyRegistry] Loaded {len(companies)} companies")
 
+    @staticmethod
+    def _cache_path() -> str:
+        return os.path.normpath(os.path.join(
+            os.path.dirname(__file__), "..", "data", "company_registry.pickle"
+        ))
+
+    @staticmethod
+    def _load_cached(csv_path: str, cache_path: str):
+        """Return (companies, symbol_index) from the pickle if it is newer than the CSV."""
+        try:
+            if os.path.getmtime(cache_path) < os.path.getmtime(csv_path):
+                return None
+            with open(cache_path, "rb") as f:
+                companies, symbol_index = pickle.load(f)
+        except Exception:
+            return None
+        if not isinstance(companies, list) or not isinstance(symbol_index, dict):
+            return None
+        return companies, symbol_index
+
+    @staticmethod
+    def _save_cached(cache_path: str, companies, symbol_index) -> None:
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump((companies, symbol_index), f, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"[CompanyRegistry] Could not write cache {cache_path}: {e}")
+
     def search(self, query: str, limit: int = 10) -> List[Dict[str, str]]:
         """
         Search companies by name or symbol. Returns up to `limit` results.
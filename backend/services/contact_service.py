@@ -3,6 +3,24 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=1, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared session keeps the connection to the webhook host alive between submissions
+_session = _build_session()
 
 
 def append_contact_submission(
@@ -37,7 +55,7 @@ def append_contact_submission(
 
     timeout = float(os.getenv("CONTACT_WEBHOOK_TIMEOUT_SECONDS", "8"))
     try:
-        response = requests.post(webhook_url, json=payload, timeout=timeout)
+        response = _session.post(webhook_url, json=payload, timeout=timeout)
     except Exception as exc:
         return False, f"Webhook request failed: {exc}"
 
@@ -1,17 +1,37 @@
 import hashlib
 import os
+from functools import lru_cache
+
+# Flag values are read from the environment once per epoch; bump the epoch
+# (see refresh_flags) to pick up environment changes without a restart.
+_ENV_EPOCH = 0
+
+# Rollout bucket for each possible first byte of the key's md5 digest
+_BUCKET_TABLE = bytes(b % 100 for b in range(256))
 
 
 def _flag_value(name: str) -> str:
     return os.getenv(name, "").strip().lower()
 
 
+def refresh_flags() -> None:
+    """Discard memoized flag decisions so the next lookup re-reads the environment."""
+    global _ENV_EPOCH
+    _ENV_EPOCH += 1
+    _is_enabled_cached.cache_clear()
+
+
 def is_enabled(flag: str, key: str | None = None) -> bool:
     """
     Feature flags support:
     - FLAG=true/false
     - FLAG_PERCENT=0-100 with optional key for deterministic rollout
     """
+    return _is_enabled_cached(flag, key or "", _ENV_EPOCH)
+
+
+@lru_cache(maxsize=4096)
+def _is_enabled_cached(flag: str, key: str, _epoch: int) -> bool:
     value = _flag_value(flag)
     if value in ("1", "true", "yes", "on"):
         return True
@@ -32,6 +52,5 @@ def is_enabled(flag: str, key: str | None = None) -> bool:
         return True
     if not key:
         return False
-    digest = hashlib.md5(key.encode("utf-8")).hexdigest()
-    bucket = int(digest[:2], 16) % 100
+    bucket = _BUCKET_TABLE[hashlib.md5(key.encode("utf-8"), usedforsecurity=False).digest()[0]]
     return bucket < percent
@@ -2,7 +2,7 @@ import os
 import threading
 import time
 from services.alerting import evaluate_alerts, emit_alert
-from services.cache_service import CacheService
+from services.cache_service import get_cache_service
 from utils.monitoring import snapshot_metrics
 from services.feature_flags import is_enabled
 from utils.logging import log
@@ -14,11 +14,12 @@ _running = False
 
 def _monitor_loop(interval_seconds: int) -> None:
     global _running
+    alerts = []
     while _running:
         try:
             metrics = snapshot_metrics()
-            cache_stats = CacheService().get_stats()
-            alerts = evaluate_alerts(metrics, cache_stats)
+            cache_stats = get_cache_service().get_stats()
+            evaluate_alerts(metrics, cache_stats, out=alerts)
             for alert in alerts:
                 emit_alert(alert["level"], alert["message"], alert["details"])
         except Exception as e:
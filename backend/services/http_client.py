@@ -1,48 +1,84 @@
 import json
 import os
 import random
+import threading
 import time
 import urllib.request
 from typing import Dict, Optional
 
+import urllib3
 
-_DEFAULT_USER_AGENTS = [
+
+_DEFAULT_USER_AGENTS = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-]
+)
+
+_RETRIES = urllib3.Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False,
+)
+_POOL_KWARGS = {"num_pools": 16, "maxsize": 32, "retries": _RETRIES}
 
+# Direct connections share one pool; each proxy keeps its own keep-alive pool.
+_POOL = urllib3.PoolManager(**_POOL_KWARGS)
+_proxy_pools: Dict[str, urllib3.ProxyManager] = {}
+_proxy_pools_lock = threading.Lock()
 
-def _get_user_agents() -> list[str]:
+
+def _get_user_agents() -> tuple[str, ...]:
     raw = os.getenv("HTTP_USER_AGENTS", "").strip()
     if not raw:
         return _DEFAULT_USER_AGENTS
-    return [ua.strip() for ua in raw.split("||") if ua.strip()]
+    return tuple(ua.strip() for ua in raw.split("||") if ua.strip()) or _DEFAULT_USER_AGENTS
 
 
-def _build_proxy_handler() -> urllib.request.ProxyHandler | None:
-    proxies: dict[str, str] = {}
-    for key in ("HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy"):
-        value = os.getenv(key)
-        if value:
-            proto = key.split("_", 1)[0].lower()
-            proxies[proto] = value
+def _get_proxies() -> tuple[str, ...]:
+    raw = os.getenv("HTTP_PROXIES", "").strip()
+    if not raw:
+        return ()
+    return tuple(proxy.strip() for proxy in raw.split(",") if proxy.strip())
 
-    if not proxies:
-        return None
 
-    no_proxy = os.getenv("NO_PROXY") or os.getenv("no_proxy")
-    if no_proxy:
-        os.environ["no_proxy"] = no_proxy
+# Rotation pools are materialized once; reload_http_config() re-reads them.
+_USER_AGENTS = _get_user_agents()
+_PROXIES = _get_proxies()
+_ENV_PROXIES = urllib.request.getproxies_environment()
 
-    return urllib.request.ProxyHandler(proxies)
 
+def reload_http_config() -> None:
+    """Re-read user agents and proxies from the environment."""
+    global _USER_AGENTS, _PROXIES, _ENV_PROXIES
+    _USER_AGENTS = _get_user_agents()
+    _PROXIES = _get_proxies()
+    _ENV_PROXIES = urllib.request.getproxies_environment()
 
-def _get_proxies() -> list[str]:
-    raw = os.getenv("HTTP_PROXIES", "").strip()
-    if not raw:
-        return []
-    return [proxy.strip() for proxy in raw.split(",") if proxy.strip()]
+
+def _env_proxy(url: str) -> Optional[str]:
+    """Proxy from HTTP_PROXY/HTTPS_PROXY for this URL, honouring NO_PROXY."""
+    if not _ENV_PROXIES:
+        return None
+    host = urllib3.util.parse_url(url).host or ""
+    if urllib.request.proxy_bypass_environment(host, _ENV_PROXIES):
+        return None
+    scheme = url.split(":", 1)[0].lower()
+    return _ENV_PROXIES.get(scheme)
+
+
+def _pool_for(proxy_url: Optional[str]) -> urllib3.PoolManager:
+    if not proxy_url:
+        return _POOL
+    pool = _proxy_pools.get(proxy_url)
+    if pool is None:
+        with _proxy_pools_lock:
+            pool = _proxy_pools.get(proxy_url)
+            if pool is None:
+                pool = urllib3.ProxyManager(proxy_url, **_POOL_KWARGS)
+                _proxy_pools[proxy_url] = pool
+    return pool
 
 
 def fetch_json(url: str, timeout: int = 20, delay_range: Optional[tuple[float, float]] = None) -> Dict:
@@ -50,24 +86,17 @@ def fetch_json(url: str, timeout: int = 20, delay_range: Optional[tuple[float, f
         time.sleep(random.uniform(delay_range[0], delay_range[1]))
 
     headers = {
-        "User-Agent": random.choice(_get_user_agents()),
+        "User-Agent": random.choice(_USER_AGENTS),
         "Accept": "application/json,text/plain,*/*",
     }
-    request = urllib.request.Request(url, headers=headers)
-
-    proxies = _get_proxies()
-    handler = _build_proxy_handler()
-    if handler:
-        opener = urllib.request.build_opener(handler)
-    else:
-        opener = urllib.request.build_opener()
-
-    if proxies:
-        proxy = random.choice(proxies)
-        opener = urllib.request.build_opener(
-            urllib.request.ProxyHandler({"http": proxy, "https": proxy})
-        )
-
-    with opener.open(request, timeout=timeout) as resp:
-        data = resp.read().decode("utf-8")
-    return json.loads(data)
+
+    proxy = random.choice(_PROXIES) if _PROXIES else _env_proxy(url)
+    resp = _pool_for(proxy).request(
+        "GET",
+        url,
+        headers=headers,
+        timeout=urllib3.Timeout(connect=5, read=timeout),
+    )
+    if resp.status >= 400:
+        raise urllib3.exceptions.HTTPError(f"HTTP {resp.status} for {url}")
+    return json.loads(resp.data)
@@ -2,7 +2,7 @@ import os
 import threading
 import time
 from services.persistent_cache import PersistentCache
-from services.cache_service import schedule_analysis_refresh
+from services.cache_service import schedule_analysis_refresh_batch
 from services.usage_analytics import maybe_get_prefetch_symbols
 from services.feature_flags import is_enabled
 from utils.logging import log
@@ -10,6 +10,7 @@ from utils.logging import log
 
 _thread = None
 _running = False
+_stop_event = threading.Event()
 
 
 def _loop() -> None:
@@ -20,6 +21,7 @@ def _loop() -> None:
     prefetch_min_requests = int(os.getenv("PREFETCH_MIN_REQUESTS", "3"))
     cache = PersistentCache()
     last_cleanup = 0.0
+    last_prefetch = 0.0
 
     while _running:
         now = time.time()
@@ -32,17 +34,27 @@ def _loop() -> None:
                 log(f"Cache cleanup failed: {e}")
             last_cleanup = now
 
-        if is_enabled("FEATURE_PREFETCH"):
-            symbols = maybe_get_prefetch_symbols(
-                top_n=prefetch_top_n,
-                window_seconds=prefetch_window,
-                min_requests=prefetch_min_requests,
-                interval_seconds=prefetch_interval,
-            )
-            for symbol in symbols:
-                schedule_analysis_refresh(symbol, "basic", 3600, delay_seconds=30.0)
+        if now - last_prefetch >= prefetch_interval:
+            if is_enabled("FEATURE_PREFETCH"):
+                symbols = maybe_get_prefetch_symbols(
+                    top_n=prefetch_top_n,
+                    window_seconds=prefetch_window,
+                    min_requests=prefetch_min_requests,
+                    interval_seconds=prefetch_interval,
+                )
+                if symbols:
+                    schedule_analysis_refresh_batch(symbols, "basic", 3600, delay_seconds=30.0)
+            last_prefetch = now
 
-        time.sleep(30)
+        # Sleep until the next action is due; stop_maintenance() wakes us immediately.
+        elapsed = time.time()
+        next_wakeup = min(
+            cleanup_interval - (elapsed - last_cleanup),
+            prefetch_interval - (elapsed - last_prefetch),
+            300,
+        )
+        if _stop_event.wait(max(1.0, next_wakeup)):
+            break
 
 
 def start_maintenance() -> None:
@@ -50,6 +62,7 @@ def start_maintenance() -> None:
     if _running:
         return
     _running = True
+    _stop_event.clear()
     _thread = threading.Thread(target=_loop, daemon=True, name="maintenance-loop")
     _thread.start()
 
@@ -57,3 +70,4 @@ def start_maintenance() -> None:
 def stop_maintenance() -> None:
     global _running
     _running = False
+    _stop_event.set()
@@ -1,20 +1,36 @@
+import functools
 import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+    BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table, TableStyle,
     PageBreak, KeepTogether, HRFlowable,
 )
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
 BRAND_NAME = "Trendova Hub"
 PAGE_WIDTH, PAGE_HEIGHT = A4
 SIDE_MARGIN = 20 * mm
 TOP_MARGIN = 25 * mm
 BOTTOM_MARGIN = 20 * mm
+CONTENT_WIDTH = PAGE_WIDTH - 2 * SIDE_MARGIN
+
+FONT_REGULAR = "Helvetica"
+FONT_BOLD = "Helvetica-Bold"
+
+# Page header/footer geometry, drawn once per page
+_HEADER_RULE_Y = PAGE_HEIGHT - 18 * mm
+_HEADER_TEXT_Y = PAGE_HEIGHT - 16 * mm
+_FOOTER_RULE_Y = BOTTOM_MARGIN - 6 * mm
+_FOOTER_TEXT_Y = BOTTOM_MARGIN - 10 * mm
+_RIGHT_EDGE = PAGE_WIDTH - SIDE_MARGIN
 
 # Colour palette
 NAVY = colors.HexColor("#0B1220")
@@ -31,8 +47,82 @@ LIGHT_GREY = colors.HexColor("#F1F5F9")
 MED_GREY = colors.HexColor("#94A3B8")
 BORDER_GREY = colors.HexColor("#CBD5E1")
 
+_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), INDIGO),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("FONTSIZE", (0, 0), (-1, 0), 9),
+    ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+    ("TOPPADDING", (0, 0), (-1, 0), 8),
+    ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+    ("FONTSIZE", (0, 1), (-1, -1), 9),
+    ("LEADING", (0, 1), (-1, -1), 12),
+    ("TEXTCOLOR", (0, 1), (-1, -1), NAVY),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, LIGHT_GREY]),
+    ("GRID", (0, 0), (-1, -1), 0.5, BORDER_GREY),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 8),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+    ("TOPPADDING", (0, 1), (-1, -1), 6),
+    ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
+])
 
-def _safe(val, fmt=None, suffix="", prefix=""):
+# Body cells with no markup that fit on one line of their column are drawn as plain
+# strings instead of Paragraphs; anything wider keeps a Paragraph so it wraps.
+_CELL_FONT = "Helvetica"
+_CELL_FONT_SIZE = 9
+_CELL_H_PADDING = 16  # LEFTPADDING + RIGHTPADDING in _TABLE_STYLE
+
+
+def _col_widths(*fractions):
+    return tuple(CONTENT_WIDTH * f for f in fractions)
+
+
+_EQUAL_COL_WIDTHS = {n: tuple([CONTENT_WIDTH / n] * n) for n in range(1, 7)}
+_KEY_METRICS_COL_WIDTHS = _col_widths(0.40, 0.30, 0.30)
+_PILLAR_COL_WIDTHS = _col_widths(0.60, 0.40)
+_DETAIL_COL_WIDTHS = _col_widths(0.35, 0.22, 0.22, 0.21)
+_BENCHMARK_COL_WIDTHS = _col_widths(0.28, 0.24, 0.24, 0.24)
+_AUDIT_COL_WIDTHS = _col_widths(0.50, 0.50)
+
+_NO_COMPARISON = ("N/A", "N/A")
+
+def _spacer(height):
+    return Spacer(1, height)
+
+
+def _hr():
+    return HRFlowable(width="100%", thickness=0.5, color=BORDER_GREY, spaceBefore=4, spaceAfter=8)
+
+
+_section_executor = None
+_section_executor_lock = threading.Lock()
+
+
+def _parallel_sections_enabled() -> bool:
+    return os.getenv("PDF_PARALLEL_SECTIONS", "true").strip().lower() in ("1", "true", "yes")
+
+
+def _get_section_executor() -> ThreadPoolExecutor:
+    global _section_executor
+    if _section_executor is None:
+        with _section_executor_lock:
+            if _section_executor is None:
+                _section_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pdf-section")
+    return _section_executor
+
+
+# Format strings shared by the section builders
+FMT_PLAIN = "{}"
+FMT_1F = "{:.1f}"
+FMT_2F = "{:.2f}"
+FMT_PRICE = "{:,.2f}"
+FMT_OUT_OF_10 = "{}/10"
+FMT_OUT_OF_9 = "{}/9"
+
+
+def _format_value(val, fmt=None, suffix="", prefix=""):
     if val is None:
         return "N/A"
     if fmt:
@@ -43,6 +133,28 @@ def _safe(val, fmt=None, suffix="", prefix=""):
     return f"{prefix}{val}{suffix}"
 
 
+# typed=True keeps 1, 1.0 and True from sharing a cached string
+_format_value_cached = functools.lru_cache(maxsize=1024, typed=True)(_format_value)
+
+
+def _safe(val, fmt=None, suffix="", prefix=""):
+    try:
+        return _format_value_cached(val, fmt, suffix, prefix)
+    except TypeError:
+        # Unhashable values (lists, dicts) skip the cache
+        return _format_value(val, fmt, suffix, prefix)
+
+
+def _format_diff(comparison):
+    if not isinstance(comparison, dict):
+        return "N/A"
+    diff = comparison.get("diff_pct")
+    if diff is None:
+        return "N/A"
+    sign = "+" if diff >= 0 else ""
+    return f"{sign}{diff}%"
+
+
 def _truncate(text, limit=2000):
     if not text:
         return ""
@@ -52,7 +164,30 @@ def _truncate(text, limit=2000):
     return text[:limit] + "..."
 
 
+class TrendovaDocTemplate(BaseDocTemplate):
+    """A4 report document with the house margins and a single page template for every page."""
+
+    def __init__(self, filename, on_page=None, **kwargs):
+        super().__init__(
+            filename,
+            pagesize=A4,
+            leftMargin=SIDE_MARGIN,
+            rightMargin=SIDE_MARGIN,
+            topMargin=TOP_MARGIN,
+            bottomMargin=BOTTOM_MARGIN,
+            author=BRAND_NAME,
+            **kwargs,
+        )
+        # Frames track layout position while rendering, so each document gets its own.
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id="normal")
+        self.addPageTemplates([
+            PageTemplate(id="report", frames=[frame], onPage=on_page, pagesize=self.pagesize),
+        ])
+
+
 class PDFReportBuilder:
+    _STYLES = None
+
     def __init__(self, data: dict):
         self.data = data
         self.symbol = data.get("symbol", "UNKNOWN")
@@ -63,168 +198,182 @@ class PDFReportBuilder:
         self.benchmarks = data.get("benchmarks") or {}
         self.ai_insights = data.get("ai_insights") or {}
         self.integrity = data.get("integrity_audit") or {}
+        self.profitability = self.ratios.get("profitability") or {}
+        self.leverage = self.ratios.get("leverage") or {}
+        self.valuation = self.ratios.get("valuation") or {}
+        self.quality = self.ratios.get("quality_scores") or {}
+        self.growth = self.ratios.get("growth_trends") or {}
+        self.avgs = self.benchmarks.get("averages") or {}
+        self.comps = self.benchmarks.get("comparisons") or {}
+        # (difference, status) per benchmark comparison key
+        self._comp_index = {
+            key: (
+                _format_diff(comp),
+                comp.get("status", "N/A") if isinstance(comp, dict) else "N/A",
+            )
+            for key, comp in self.comps.items()
+        }
         self.generated_at = datetime.now()
+        self._page_title = f"{self.symbol} Stock Analysis Report"
+        self._generated_label = f"Generated: {self.generated_at.strftime('%d %b %Y, %I:%M %p')}"
         self._build_styles()
 
     def _build_styles(self):
+        # Styles are never mutated after creation, so every builder shares one set.
+        if PDFReportBuilder._STYLES is None:
+            PDFReportBuilder._STYLES = self._create_styles()
+        self.styles = PDFReportBuilder._STYLES
+
+    @staticmethod
+    def _create_styles():
         base = getSampleStyleSheet()
-        self.styles = {}
+        styles = {}
 
-        self.styles["title"] = ParagraphStyle(
+        styles["title"] = ParagraphStyle(
             "ReportTitle", parent=base["Title"],
             fontName="Helvetica-Bold", fontSize=28, leading=34,
             textColor=NAVY, spaceAfter=4,
         )
-        self.styles["subtitle"] = ParagraphStyle(
+        styles["subtitle"] = ParagraphStyle(
             "ReportSubtitle", parent=base["Normal"],
             fontName="Helvetica", fontSize=14, leading=18,
             textColor=MED_GREY, spaceAfter=2,
         )
-        self.styles["section"] = ParagraphStyle(
+        styles["section"] = ParagraphStyle(
             "SectionHeading", parent=base["Heading2"],
             fontName="Helvetica-Bold", fontSize=15, leading=20,
             textColor=INDIGO, spaceBefore=18, spaceAfter=8,
             borderPadding=(0, 0, 2, 0),
         )
-        self.styles["body"] = ParagraphStyle(
+        styles["body"] = ParagraphStyle(
             "BodyText", parent=base["Normal"],
             fontName="Helvetica", fontSize=10, leading=14,
             textColor=NAVY, alignment=TA_JUSTIFY,
         )
-        self.styles["body_small"] = ParagraphStyle(
+        styles["body_small"] = ParagraphStyle(
             "BodySmall", parent=base["Normal"],
             fontName="Helvetica", fontSize=9, leading=12,
             textColor=DARK_SLATE,
         )
-        self.styles["label"] = ParagraphStyle(
+        styles["label"] = ParagraphStyle(
             "Label", parent=base["Normal"],
             fontName="Helvetica-Bold", fontSize=10, leading=13,
             textColor=DARK_SLATE,
         )
-        self.styles["value_big"] = ParagraphStyle(
+        styles["value_big"] = ParagraphStyle(
             "ValueBig", parent=base["Normal"],
             fontName="Helvetica-Bold", fontSize=20, leading=26,
             textColor=NAVY,
         )
-        self.styles["quote"] = ParagraphStyle(
+        styles["quote"] = ParagraphStyle(
             "Quote", parent=base["Normal"],
             fontName="Helvetica-Oblique", fontSize=10, leading=14,
             textColor=DARK_SLATE, leftIndent=12, rightIndent=12,
             borderPadding=(8, 8, 8, 8), alignment=TA_JUSTIFY,
         )
-        self.styles["disclaimer"] = ParagraphStyle(
+        styles["disclaimer"] = ParagraphStyle(
             "Disclaimer", parent=base["Normal"],
             fontName="Helvetica", fontSize=7, leading=10,
             textColor=MED_GREY, alignment=TA_JUSTIFY,
         )
-        self.styles["bullet"] = ParagraphStyle(
+        styles["bullet"] = ParagraphStyle(
             "Bullet", parent=base["Normal"],
             fontName="Helvetica", fontSize=10, leading=14,
             textColor=DARK_SLATE, leftIndent=16,
             bulletFontName="Helvetica", bulletFontSize=10,
             bulletIndent=4,
         )
-        self.styles["table_header"] = ParagraphStyle(
+        styles["table_header"] = ParagraphStyle(
             "TableHeader", parent=base["Normal"],
             fontName="Helvetica-Bold", fontSize=9, leading=12,
             textColor=colors.white,
         )
-        self.styles["table_cell"] = ParagraphStyle(
+        styles["table_cell"] = ParagraphStyle(
             "TableCell", parent=base["Normal"],
             fontName="Helvetica", fontSize=9, leading=12,
             textColor=NAVY,
         )
-        self.styles["table_cell_bold"] = ParagraphStyle(
+        styles["table_cell_bold"] = ParagraphStyle(
             "TableCellBold", parent=base["Normal"],
             fontName="Helvetica-Bold", fontSize=9, leading=12,
             textColor=NAVY,
         )
-        self.styles["ai_label"] = ParagraphStyle(
+        styles["ai_label"] = ParagraphStyle(
             "AILabel", parent=base["Normal"],
             fontName="Helvetica-Bold", fontSize=12, leading=16,
             textColor=INDIGO, spaceBefore=12, spaceAfter=4,
         )
-        self.styles["center"] = ParagraphStyle(
+        styles["center"] = ParagraphStyle(
             "Centered", parent=base["Normal"],
             fontName="Helvetica", fontSize=10, leading=14,
             textColor=MED_GREY, alignment=TA_CENTER,
         )
+        return styles
 
     def _header_footer(self, canvas, doc):
         canvas.saveState()
-        # Header line
+        # Rules first, then text grouped by font so each page switches fonts only twice
         canvas.setStrokeColor(INDIGO)
         canvas.setLineWidth(1.5)
-        canvas.line(SIDE_MARGIN, PAGE_HEIGHT - 18 * mm,
-                    PAGE_WIDTH - SIDE_MARGIN, PAGE_HEIGHT - 18 * mm)
-        canvas.setFont("Helvetica-Bold", 8)
-        canvas.setFillColor(INDIGO)
-        canvas.drawString(SIDE_MARGIN, PAGE_HEIGHT - 16 * mm, BRAND_NAME)
-        canvas.setFont("Helvetica", 8)
-        canvas.setFillColor(MED_GREY)
-        title = f"{self.symbol} Stock Analysis Report"
-        canvas.drawRightString(PAGE_WIDTH - SIDE_MARGIN, PAGE_HEIGHT - 16 * mm, title)
-
-        # Footer
+        canvas.line(SIDE_MARGIN, _HEADER_RULE_Y, _RIGHT_EDGE, _HEADER_RULE_Y)
         canvas.setStrokeColor(BORDER_GREY)
         canvas.setLineWidth(0.5)
-        canvas.line(SIDE_MARGIN, BOTTOM_MARGIN - 6 * mm,
-                    PAGE_WIDTH - SIDE_MARGIN, BOTTOM_MARGIN - 6 * mm)
-        canvas.setFont("Helvetica", 7)
+        canvas.line(SIDE_MARGIN, _FOOTER_RULE_Y, _RIGHT_EDGE, _FOOTER_RULE_Y)
+
+        canvas.setFont(FONT_BOLD, 8)
+        canvas.setFillColor(INDIGO)
+        canvas.drawString(SIDE_MARGIN, _HEADER_TEXT_Y, BRAND_NAME)
+        canvas.setFont(FONT_REGULAR, 8)
         canvas.setFillColor(MED_GREY)
-        canvas.drawString(SIDE_MARGIN, BOTTOM_MARGIN - 10 * mm,
-                          f"Generated: {self.generated_at.strftime('%d %b %Y, %I:%M %p')}")
-        canvas.drawRightString(PAGE_WIDTH - SIDE_MARGIN, BOTTOM_MARGIN - 10 * mm,
-                               f"Page {doc.page}")
+        canvas.drawRightString(_RIGHT_EDGE, _HEADER_TEXT_Y, self._page_title)
+        canvas.setFont(FONT_REGULAR, 7)
+        canvas.drawString(SIDE_MARGIN, _FOOTER_TEXT_Y, self._generated_label)
+        canvas.drawRightString(_RIGHT_EDGE, _FOOTER_TEXT_Y, f"Page {doc.page}")
         canvas.restoreState()
 
+    def _header_cells(self, headers):
+        # Flowables hold drawing state, so each table gets its own header Paragraphs
+        style = self.styles["table_header"]
+        return [Paragraph(h, style) for h in headers]
+
+    def _table_cell(self, value, max_width):
+        text = str(value)
+        if (
+            "<" not in text
+            and "&" not in text
+            and "\n" not in text
+            and stringWidth(text, _CELL_FONT, _CELL_FONT_SIZE) <= max_width
+        ):
+            return text
+        return Paragraph(text, self.styles["table_cell"])
+
     def _make_table(self, headers, rows, col_widths=None):
-        content_width = PAGE_WIDTH - 2 * SIDE_MARGIN
-        header_cells = [Paragraph(h, self.styles["table_header"]) for h in headers]
-        table_data = [header_cells]
+        if col_widths is None:
+            n = len(headers)
+            col_widths = _EQUAL_COL_WIDTHS.get(n) or [CONTENT_WIDTH / n] * n
+        text_widths = [w - _CELL_H_PADDING for w in col_widths]
+
+        table_data = [self._header_cells(headers)]
         for row in rows:
             table_data.append([
-                Paragraph(str(c), self.styles["table_cell"]) for c in row
+                self._table_cell(c, text_widths[i] if i < len(text_widths) else 0)
+                for i, c in enumerate(row)
             ])
 
-        if col_widths is None:
-            n = len(headers)
-            col_widths = [content_width / n] * n
-
         t = Table(table_data, colWidths=col_widths, repeatRows=1)
-        t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), INDIGO),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 9),
-            ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-            ("TOPPADDING", (0, 0), (-1, 0), 8),
-            ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, LIGHT_GREY]),
-            ("GRID", (0, 0), (-1, -1), 0.5, BORDER_GREY),
-            ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-            ("LEFTPADDING", (0, 0), (-1, -1), 8),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-            ("TOPPADDING", (0, 1), (-1, -1), 6),
-            ("BOTTOMPADDING", (0, 1), (-1, -1), 6),
-        ]))
+        t.setStyle(_TABLE_STYLE)
         return t
 
     def _section_heading(self, text):
         return Paragraph(text, self.styles["section"])
 
-    def _hr(self):
-        return HRFlowable(width="100%", thickness=0.5, color=BORDER_GREY,
-                          spaceBefore=4, spaceAfter=8)
-
     # ─── Section builders ───
 
-    def _build_header(self):
-        elements = []
-        elements.append(Paragraph(self.symbol, self.styles["title"]))
+    def _build_header(self, story: list) -> None:
+        story.append(Paragraph(self.symbol, self.styles["title"]))
         name = self.profile.get("name", "")
         if name:
-            elements.append(Paragraph(name, self.styles["subtitle"]))
+            story.append(Paragraph(name, self.styles["subtitle"]))
 
         tags = []
         if self.profile.get("sector"):
@@ -232,223 +381,171 @@ class PDFReportBuilder:
         if self.profile.get("industry"):
             tags.append(self.profile["industry"])
         if tags:
-            elements.append(Paragraph(" | ".join(tags), self.styles["body_small"]))
+            story.append(Paragraph(" | ".join(tags), self.styles["body_small"]))
 
-        elements.append(Spacer(1, 6))
+        story.append(_spacer(6))
 
-        price_str = _safe(self.price.get("current"), "{:,.2f}", prefix="Rs ")
+        price_str = _safe(self.price.get("current"), FMT_PRICE, prefix="Rs ")
         date_str = _safe(self.price.get("date"))
         stance_str = self.stance.get("overall_stance", "N/A")
-        score_str = _safe(self.stance.get("overall_score"), "{}/10")
+        score_str = _safe(self.stance.get("overall_score"), FMT_OUT_OF_10)
 
         info_line = f"<b>Price:</b> {price_str} ({date_str})&nbsp;&nbsp;&nbsp;|&nbsp;&nbsp;&nbsp;<b>Stance:</b> {stance_str}&nbsp;&nbsp;&nbsp;|&nbsp;&nbsp;&nbsp;<b>Score:</b> {score_str}"
-        elements.append(Paragraph(info_line, self.styles["body"]))
-        elements.append(self._hr())
-        return elements
+        story.append(Paragraph(info_line, self.styles["body"]))
+        story.append(_hr())
 
-    def _build_overview(self):
+    def _build_overview(self, story: list) -> None:
         desc = self.profile.get("description")
         if not desc:
-            return []
-        elements = []
-        elements.append(self._section_heading("Company Overview"))
-        elements.append(Paragraph(desc, self.styles["body"]))
-        elements.append(Spacer(1, 6))
-        return elements
-
-    def _build_key_metrics(self):
-        profitability = self.ratios.get("profitability", {})
-        leverage = self.ratios.get("leverage", {})
-        valuation = self.ratios.get("valuation", {})
-        quality = self.ratios.get("quality_scores", {})
-        avgs = self.benchmarks.get("averages", {})
+            return
+        story.append(self._section_heading("Company Overview"))
+        story.append(Paragraph(desc, self.styles["body"]))
+        story.append(_spacer(6))
 
+    def _build_key_metrics(self, story: list) -> None:
         rows = [
-            ["ROE", _safe(profitability.get("roe"), "{:.1f}", "%"),
-             _safe(avgs.get("avg_roe"), "{}", "%")],
-            ["Net Margin", _safe(profitability.get("net_margin"), "{:.1f}", "%"),
-             _safe(avgs.get("avg_net_margin"), "{}", "%")],
-            ["Debt/Equity", _safe(leverage.get("debt_to_equity"), "{:.2f}"),
-             _safe(avgs.get("avg_debt_equity"), "{}")],
-            ["P/E Ratio", _safe(valuation.get("pe_ratio"), "{:.1f}"),
-             _safe(avgs.get("avg_pe"), "{}")],
-            ["F-Score", _safe(quality.get("piotroski_f_score"), "{}/9"),
+            ["ROE", _safe(self.profitability.get("roe"), FMT_1F, "%"),
+             _safe(self.avgs.get("avg_roe"), FMT_PLAIN, "%")],
+            ["Net Margin", _safe(self.profitability.get("net_margin"), FMT_1F, "%"),
+             _safe(self.avgs.get("avg_net_margin"), FMT_PLAIN, "%")],
+            ["Debt/Equity", _safe(self.leverage.get("debt_to_equity"), FMT_2F),
+             _safe(self.avgs.get("avg_debt_equity"), FMT_PLAIN)],
+            ["P/E Ratio", _safe(self.valuation.get("pe_ratio"), FMT_1F),
+             _safe(self.avgs.get("avg_pe"), FMT_PLAIN)],
+            ["F-Score", _safe(self.quality.get("piotroski_f_score"), FMT_OUT_OF_9),
              "6/9"],
-            ["Z-Score", _safe(quality.get("altman_z_score"), "{:.2f}"),
+            ["Z-Score", _safe(self.quality.get("altman_z_score"), FMT_2F),
              "3.0"],
         ]
 
-        content_width = PAGE_WIDTH - 2 * SIDE_MARGIN
-        elements = [
-            self._section_heading("Key Metrics at a Glance"),
-            self._make_table(
-                ["Metric", "Value", "Sector Avg"],
-                rows,
-                col_widths=[content_width * 0.40, content_width * 0.30, content_width * 0.30],
-            ),
-            Spacer(1, 6),
-        ]
-        return elements
+        story.append(self._section_heading("Key Metrics at a Glance"))
+        story.append(self._make_table(
+            ["Metric", "Value", "Sector Avg"],
+            rows,
+            col_widths=_KEY_METRICS_COL_WIDTHS,
+        ))
+        story.append(_spacer(6))
 
-    def _build_fundamental_stance(self):
-        elements = [self._section_heading("Fundamental Stance")]
+    def _build_fundamental_stance(self, story: list) -> None:
+        story.append(self._section_heading("Fundamental Stance"))
 
-        score_str = _safe(self.stance.get("overall_score"), "{}/10")
+        score_str = _safe(self.stance.get("overall_score"), FMT_OUT_OF_10)
         stance_str = self.stance.get("overall_stance", "N/A")
-        elements.append(Paragraph(
+        story.append(Paragraph(
             f"<b>Overall:</b> {stance_str} ({score_str})", self.styles["body"]
         ))
-        elements.append(Spacer(1, 4))
+        story.append(_spacer(4))
 
         pillars = self.stance.get("pillar_scores", {})
         pillar_rows = [
-            ["Business Quality", _safe(pillars.get("business_quality"), "{}/10")],
-            ["Financial Safety", _safe(pillars.get("financial_safety"), "{}/10")],
-            ["Valuation Comfort", _safe(pillars.get("valuation_comfort"), "{}/10")],
+            ["Business Quality", _safe(pillars.get("business_quality"), FMT_OUT_OF_10)],
+            ["Financial Safety", _safe(pillars.get("financial_safety"), FMT_OUT_OF_10)],
+            ["Valuation Comfort", _safe(pillars.get("valuation_comfort"), FMT_OUT_OF_10)],
         ]
-        content_width = PAGE_WIDTH - 2 * SIDE_MARGIN
-        elements.append(self._make_table(
+        story.append(self._make_table(
             ["Pillar", "Score"],
             pillar_rows,
-            col_widths=[content_width * 0.60, content_width * 0.40],
+            col_widths=_PILLAR_COL_WIDTHS,
         ))
-        elements.append(Spacer(1, 6))
+        story.append(_spacer(6))
 
         red_flags = self.stance.get("red_flags", [])
         if red_flags:
-            elements.append(Paragraph("<b>Red Flags:</b>", self.styles["label"]))
+            story.append(Paragraph("<b>Red Flags:</b>", self.styles["label"]))
             for flag in red_flags:
-                elements.append(Paragraph(
+                story.append(Paragraph(
                     f"\u2022 {flag}", self.styles["bullet"]
                 ))
-            elements.append(Spacer(1, 4))
-
-        return elements
-
-    def _build_detailed_financials(self):
-        elements = [self._section_heading("Detailed Financial Analysis")]
+            story.append(_spacer(4))
 
-        profitability = self.ratios.get("profitability", {})
-        leverage = self.ratios.get("leverage", {})
-        valuation = self.ratios.get("valuation", {})
-        quality = self.ratios.get("quality_scores", {})
-        growth = self.ratios.get("growth_trends", {})
-        avgs = self.benchmarks.get("averages", {})
-        comps = self.benchmarks.get("comparisons", {})
+    def _build_detailed_financials(self, story: list) -> None:
+        story.append(self._section_heading("Detailed Financial Analysis"))
 
         def status_for(key):
-            c = comps.get(key, {})
-            return c.get("status", "N/A") if isinstance(c, dict) else "N/A"
+            return self._comp_index.get(key, _NO_COMPARISON)[1]
 
         categories = [
             ("Growth", [
-                ["Revenue CAGR (3Y)", _safe(growth.get("revenue_cagr_3y"), "{}", "%"), _safe(avgs.get("avg_net_margin"), "{}", "%"), "N/A"],
-                ["Margin Stability", _safe(growth.get("margin_stability")), "Stable", "N/A"],
+                ["Revenue CAGR (3Y)", _safe(self.growth.get("revenue_cagr_3y"), FMT_PLAIN, "%"), _safe(self.avgs.get("avg_net_margin"), FMT_PLAIN, "%"), "N/A"],
+                ["Margin Stability", _safe(self.growth.get("margin_stability")), "Stable", "N/A"],
             ]),
             ("Profitability", [
-                ["ROE", _safe(profitability.get("roe"), "{:.1f}", "%"), _safe(avgs.get("avg_roe"), "{}", "%"), status_for("roe")],
-                ["ROA", _safe(profitability.get("roa"), "{:.1f}", "%"), "15%", "N/A"],
-                ["Net Margin", _safe(profitability.get("net_margin"), "{:.1f}", "%"), _safe(avgs.get("avg_net_margin"), "{}", "%"), status_for("net_margin")],
+                ["ROE", _safe(self.profitability.get("roe"), FMT_1F, "%"), _safe(self.avgs.get("avg_roe"), FMT_PLAIN, "%"), status_for("roe")],
+                ["ROA", _safe(self.profitability.get("roa"), FMT_1F, "%"), "15%", "N/A"],
+                ["Net Margin", _safe(self.profitability.get("net_margin"), FMT_1F, "%"), _safe(self.avgs.get("avg_net_margin"), FMT_PLAIN, "%"), status_for("net_margin")],
             ]),
             ("Leverage", [
-                ["Debt/Equity", _safe(leverage.get("debt_to_equity"), "{:.2f}"), _safe(avgs.get("avg_debt_equity"), "{}"), status_for("debt_to_equity")],
+                ["Debt/Equity", _safe(self.leverage.get("debt_to_equity"), FMT_2F), _safe(self.avgs.get("avg_debt_equity"), FMT_PLAIN), status_for("debt_to_equity")],
             ]),
             ("Valuation", [
-                ["P/E Ratio", _safe(valuation.get("pe_ratio"), "{:.1f}"), _safe(avgs.get("avg_pe"), "{}"), status_for("pe")],
+                ["P/E Ratio", _safe(self.valuation.get("pe_ratio"), FMT_1F), _safe(self.avgs.get("avg_pe"), FMT_PLAIN), status_for("pe")],
             ]),
             ("Quality Scores", [
-                ["Piotroski F-Score", _safe(quality.get("piotroski_f_score"), "{}/9"), "6/9", "N/A"],
-                ["Altman Z-Score", _safe(quality.get("altman_z_score"), "{:.2f}"), "3.0", "N/A"],
+                ["Piotroski F-Score", _safe(self.quality.get("piotroski_f_score"), FMT_OUT_OF_9), "6/9", "N/A"],
+                ["Altman Z-Score", _safe(self.quality.get("altman_z_score"), FMT_2F), "3.0", "N/A"],
             ]),
         ]
 
-        content_width = PAGE_WIDTH - 2 * SIDE_MARGIN
         for cat_name, rows in categories:
-            elements.append(Paragraph(f"<b>{cat_name}</b>", self.styles["label"]))
-            elements.append(Spacer(1, 2))
-            elements.append(self._make_table(
+            story.append(Paragraph(f"<b>{cat_name}</b>", self.styles["label"]))
+            story.append(_spacer(2))
+            story.append(self._make_table(
                 ["Metric", "Value", "Sector Avg", "Status"],
                 rows,
-                col_widths=[
-                    content_width * 0.35,
-                    content_width * 0.22,
-                    content_width * 0.22,
-                    content_width * 0.21,
-                ],
+                col_widths=_DETAIL_COL_WIDTHS,
             ))
-            elements.append(Spacer(1, 8))
+            story.append(_spacer(8))
 
-        return elements
-
-    def _build_sector_benchmarks(self):
-        elements = [self._section_heading("Sector Benchmark Comparison")]
+    def _build_sector_benchmarks(self, story: list) -> None:
+        story.append(self._section_heading("Sector Benchmark Comparison"))
 
         sector = self.benchmarks.get("sector", "Default")
-        elements.append(Paragraph(f"Compared against <b>{sector}</b> sector averages.", self.styles["body_small"]))
-        elements.append(Spacer(1, 4))
-
-        avgs = self.benchmarks.get("averages", {})
-        comps = self.benchmarks.get("comparisons", {})
-        profitability = self.ratios.get("profitability", {})
-        leverage = self.ratios.get("leverage", {})
-        valuation = self.ratios.get("valuation", {})
+        story.append(Paragraph(f"Compared against <b>{sector}</b> sector averages.", self.styles["body_small"]))
+        story.append(_spacer(4))
 
         def diff_str(key):
-            c = comps.get(key, {})
-            if not isinstance(c, dict):
-                return "N/A"
-            diff = c.get("diff_pct")
-            if diff is None:
-                return "N/A"
-            sign = "+" if diff >= 0 else ""
-            return f"{sign}{diff}%"
+            return self._comp_index.get(key, _NO_COMPARISON)[0]
 
         rows = [
             ["ROE",
-             _safe(profitability.get("roe"), "{:.1f}", "%"),
-             _safe(avgs.get("avg_roe"), "{}", "%"),
+             _safe(self.profitability.get("roe"), FMT_1F, "%"),
+             _safe(self.avgs.get("avg_roe"), FMT_PLAIN, "%"),
              diff_str("roe")],
             ["P/E Ratio",
-             _safe(valuation.get("pe_ratio"), "{:.1f}"),
-             _safe(avgs.get("avg_pe"), "{}"),
+             _safe(self.valuation.get("pe_ratio"), FMT_1F),
+             _safe(self.avgs.get("avg_pe"), FMT_PLAIN),
              diff_str("pe")],
             ["Debt/Equity",
-             _safe(leverage.get("debt_to_equity"), "{:.2f}"),
-             _safe(avgs.get("avg_debt_equity"), "{}"),
+             _safe(self.leverage.get("debt_to_equity"), FMT_2F),
+             _safe(self.avgs.get("avg_debt_equity"), FMT_PLAIN),
              diff_str("debt_to_equity")],
             ["Net Margin",
-             _safe(profitability.get("net_margin"), "{:.1f}", "%"),
-             _safe(avgs.get("avg_net_margin"), "{}", "%"),
+             _safe(self.profitability.get("net_margin"), FMT_1F, "%"),
+             _safe(self.avgs.get("avg_net_margin"), FMT_PLAIN, "%"),
              diff_str("net_margin")],
         ]
 
-        content_width = PAGE_WIDTH - 2 * SIDE_MARGIN
-        elements.append(self._make_table(
+        story.append(self._make_table(
             ["Metric", "Company", "Sector Avg", "Difference"],
             rows,
-            col_widths=[
-                content_width * 0.28,
-                content_width * 0.24,
-                content_width * 0.24,
-                content_width * 0.24,
-            ],
+            col_widths=_BENCHMARK_COL_WIDTHS,
         ))
-        elements.append(Spacer(1, 6))
-        return elements
+        story.append(_spacer(6))
 
-    def _build_ai_perspectives(self):
-        elements = [PageBreak(), self._section_heading("AI-Powered Perspectives")]
+    def _build_ai_perspectives(self, story: list) -> None:
+        story.append(PageBreak())
+        story.append(self._section_heading("AI-Powered Perspectives"))
 
         ai = self.ai_insights
         has_content = any(ai.get(k) for k in ("final_verdict", "analyst", "contrarian", "educator"))
 
         if not has_content:
-            elements.append(Paragraph(
+            story.append(Paragraph(
                 "AI insights were not included in this report.",
                 self.styles["center"],
             ))
-            elements.append(Spacer(1, 8))
-            return elements
+            story.append(_spacer(8))
+            return
 
         # Final Verdict box
         verdict = ai.get("final_verdict", "")
@@ -456,7 +553,7 @@ class PDFReportBuilder:
             verdict_text = _truncate(verdict)
             verdict_table = Table(
                 [[Paragraph(f"<b>Final Verdict:</b> {verdict_text}", self.styles["body"])]],
-                colWidths=[PAGE_WIDTH - 2 * SIDE_MARGIN],
+                colWidths=[CONTENT_WIDTH],
             )
             verdict_table.setStyle(TableStyle([
                 ("BACKGROUND", (0, 0), (-1, -1), LIGHT_INDIGO),
@@ -466,8 +563,8 @@ class PDFReportBuilder:
                 ("TOPPADDING", (0, 0), (-1, -1), 10),
                 ("BOTTOMPADDING", (0, 0), (-1, -1), 10),
             ]))
-            elements.append(verdict_table)
-            elements.append(Spacer(1, 12))
+            story.append(verdict_table)
+            story.append(_spacer(12))
 
         perspectives = [
             ("Professional Analyst View", ai.get("analyst", "")),
@@ -476,16 +573,14 @@ class PDFReportBuilder:
         ]
         for title, text in perspectives:
             if text:
-                elements.append(Paragraph(title, self.styles["ai_label"]))
-                elements.append(Paragraph(
+                story.append(Paragraph(title, self.styles["ai_label"]))
+                story.append(Paragraph(
                     f'"{_truncate(text)}"', self.styles["quote"]
                 ))
-                elements.append(Spacer(1, 8))
+                story.append(_spacer(8))
 
-        return elements
-
-    def _build_integrity_audit(self):
-        elements = [self._section_heading("Data Integrity Audit")]
+    def _build_integrity_audit(self, story: list) -> None:
+        story.append(self._section_heading("Data Integrity Audit"))
 
         completeness = self.integrity.get("data_completeness") or {}
         confidence = completeness.get("confidence", "N/A")
@@ -496,24 +591,21 @@ class PDFReportBuilder:
             ["Data Confidence", f"{confidence}%"if confidence != "N/A" else "N/A"],
             ["Audit Status", audit_status],
         ]
-        content_width = PAGE_WIDTH - 2 * SIDE_MARGIN
-        elements.append(self._make_table(
+        story.append(self._make_table(
             ["Check", "Result"],
             rows,
-            col_widths=[content_width * 0.50, content_width * 0.50],
+            col_widths=_AUDIT_COL_WIDTHS,
         ))
-        elements.append(Spacer(1, 4))
+        story.append(_spacer(4))
 
         warnings = self.integrity.get("warnings", [])
         if warnings:
-            elements.append(Paragraph("<b>Warnings:</b>", self.styles["label"]))
+            story.append(Paragraph("<b>Warnings:</b>", self.styles["label"]))
             for w in warnings:
-                elements.append(Paragraph(f"\u2022 {w}", self.styles["bullet"]))
-            elements.append(Spacer(1, 4))
-
-        return elements
+                story.append(Paragraph(f"\u2022 {w}", self.styles["bullet"]))
+            story.append(_spacer(4))
 
-    def _build_disclaimer(self):
+    def _build_disclaimer(self, story: list) -> None:
         disclaimer_text = (
             "DISCLAIMER: This report is an educational analysis generated by Trendova Hub, "
             "not fixed investment advice. All information is provided for learning purposes only. "
@@ -523,42 +615,53 @@ class PDFReportBuilder:
             "Trendova Hub and its affiliates are not responsible for any financial losses. "
             f"Report generated on {self.generated_at.strftime('%d %b %Y at %I:%M %p')}."
         )
-        return [
-            Spacer(1, 20),
-            self._hr(),
-            Paragraph("Legal Disclosure &amp; Risk Disclaimer", self.styles["label"]),
-            Spacer(1, 4),
-            Paragraph(disclaimer_text, self.styles["disclaimer"]),
-            Spacer(1, 8),
-            Paragraph(
-                f"\u00a9 {self.generated_at.year} {BRAND_NAME} | Assets Analysis Intelligence",
-                self.styles["disclaimer"],
-            ),
-        ]
+        story.append(_spacer(20))
+        story.append(_hr())
+        story.append(Paragraph("Legal Disclosure &amp; Risk Disclaimer", self.styles["label"]))
+        story.append(_spacer(4))
+        story.append(Paragraph(disclaimer_text, self.styles["disclaimer"]))
+        story.append(_spacer(8))
+        story.append(Paragraph(
+            f"\u00a9 {self.generated_at.year} {BRAND_NAME} | Assets Analysis Intelligence",
+            self.styles["disclaimer"],
+        ))
 
     def build(self) -> bytes:
         buf = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buf,
-            pagesize=A4,
-            leftMargin=SIDE_MARGIN,
-            rightMargin=SIDE_MARGIN,
-            topMargin=TOP_MARGIN,
-            bottomMargin=BOTTOM_MARGIN,
+        self.build_to(buf)
+        return buf.getvalue()
+
+    def build_to(self, fp) -> None:
+        """Render the report straight into a writable binary file-like object."""
+        doc = TrendovaDocTemplate(
+            fp,
+            on_page=self._header_footer,
             title=f"{self.symbol} Analysis Report",
-            author=BRAND_NAME,
         )
 
+        builders = (
+            self._build_header,
+            self._build_overview,
+            self._build_key_metrics,
+            self._build_fundamental_stance,
+            self._build_detailed_financials,
+            self._build_sector_benchmarks,
+            self._build_ai_perspectives,
+            self._build_integrity_audit,
+            self._build_disclaimer,
+        )
         story = []
-        story.extend(self._build_header())
-        story.extend(self._build_overview())
-        story.extend(self._build_key_metrics())
-        story.extend(self._build_fundamental_stance())
-        story.extend(self._build_detailed_financials())
-        story.extend(self._build_sector_benchmarks())
-        story.extend(self._build_ai_perspectives())
-        story.extend(self._build_integrity_audit())
-        story.extend(self._build_disclaimer())
-
-        doc.build(story, onFirstPage=self._header_footer, onLaterPages=self._header_footer)
-        return buf.getvalue()
+        if _parallel_sections_enabled():
+            # Sections are independent; each concurrent builder fills its own list,
+            # and the lists are joined in the fixed order.
+            executor = _get_section_executor()
+            sections = [[] for _ in builders]
+            futures = [executor.submit(b, section) for b, section in zip(builders, sections)]
+            for future, section in zip(futures, sections):
+                future.result()
+                story.extend(section)
+        else:
+            for b in builders:
+                b(story)
+
+        doc.build(story)
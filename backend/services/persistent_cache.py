@@ -1,9 +1,28 @@
 import os
-import json
+import random
 import sqlite3
 import threading
 import time
-from typing import Any, Optional, Tuple
+import weakref
+from typing import Any, Iterable, Optional, Tuple
+
+import orjson
+
+# Expiry is spread by +/- this fraction of the TTL so keys written together don't expire together
+_TTL_JITTER = 0.1
+# Reads past this fraction of an entry's lifetime are told to refresh it early
+_EARLY_REFRESH_FRACTION = 0.9
+
+
+class _ThreadConnection:
+    """Owns one thread's connection; closed when the owning thread's locals are released."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self._finalizer = weakref.finalize(self, conn.close)
+
+    def close(self) -> None:
+        self._finalizer()
 
 
 class PersistentCache:
@@ -14,43 +33,119 @@ class PersistentCache:
             db_path = os.path.join(base_dir, "cache.sqlite")
         self.db_path = db_path
         self._lock = threading.Lock()
+        # One connection per thread; WAL lets readers proceed without a shared mutex.
+        # The thread-local owns each connection, so it is closed when its thread exits;
+        # the weak registry only lets close() reach connections still alive.
+        self._tls = threading.local()
+        self._connections: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
         self._init_db()
 
+    def _conn(self) -> sqlite3.Connection:
+        holder = getattr(self._tls, "holder", None)
+        if holder is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            holder = _ThreadConnection(conn)
+            self._tls.holder = holder
+            with self._lock:
+                self._connections.add(holder)
+        return holder.conn
+
     def _init_db(self) -> None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS cache_entries (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    cached_at REAL NOT NULL,
-                    expires_at REAL NOT NULL
-                )
-                """
+        conn = self._conn()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                cached_at REAL NOT NULL,
+                expires_at REAL NOT NULL
             )
-            conn.commit()
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_expires_at ON cache_entries(expires_at)"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            holders = list(self._connections)
+            self._connections = weakref.WeakSet()
+        for holder in holders:
+            holder.close()
+        self._tls = threading.local()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def get(self, key: str) -> Optional[Tuple[Any, float, float]]:
-        with self._lock, sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
-                "SELECT value, cached_at, expires_at FROM cache_entries WHERE key = ?",
-                (key,),
-            ).fetchone()
+        row = self._conn().execute(
+            "SELECT value, cached_at, expires_at FROM cache_entries WHERE key = ?",
+            (key,),
+        ).fetchone()
         if not row:
             return None
-        value_json, cached_at, expires_at = row
+        raw_value, cached_at, expires_at = row
         try:
-            value = json.loads(value_json)
+            # Rows written before the BLOB switch hold TEXT JSON; orjson reads both.
+            value = orjson.loads(raw_value)
         except Exception:
             value = None
         return value, cached_at, expires_at
 
+    def get_with_refresh_hint(self, key: str) -> Optional[Tuple[Any, float, float, bool]]:
+        """
+        Like get(), plus a flag telling the caller to refresh the entry in the background.
+        The flag is only set inside the early window before expiry; expired entries are
+        left to the caller's own stale handling.
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+        value, cached_at, expires_at = entry
+        refresh_at = cached_at + _EARLY_REFRESH_FRACTION * (expires_at - cached_at)
+        return value, cached_at, expires_at, refresh_at < time.time() < expires_at
+
     def set(self, key: str, value: Any, ttl: int) -> None:
         now = time.time()
-        expires_at = now + ttl
-        payload = json.dumps(value)
-        with self._lock, sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        expires_at = now + ttl * random.uniform(1 - _TTL_JITTER, 1 + _TTL_JITTER)
+        payload = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        self._conn().execute(
+            """
+            INSERT INTO cache_entries (key, value, cached_at, expires_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                value=excluded.value,
+                cached_at=excluded.cached_at,
+                expires_at=excluded.expires_at
+            """,
+            (key, payload, now, expires_at),
+        )
+
+    def set_many(self, items: Iterable[Tuple[str, Any, int]]) -> None:
+        """Write (key, value, ttl) triples in a single transaction."""
+        now = time.time()
+        rows = [
+            (
+                key,
+                orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS),
+                now,
+                now + ttl * random.uniform(1 - _TTL_JITTER, 1 + _TTL_JITTER),
+            )
+            for key, value, ttl in items
+        ]
+        if not rows:
+            return
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
                 """
                 INSERT INTO cache_entries (key, value, cached_at, expires_at)
                 VALUES (?, ?, ?, ?)
@@ -59,13 +154,31 @@ class PersistentCache:
                     cached_at=excluded.cached_at,
                     expires_at=excluded.expires_at
                 """,
-                (key, payload, now, expires_at),
+                rows,
             )
-            conn.commit()
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
-    def cleanup(self) -> int:
+    def cleanup(self, batch_size: int = 1000) -> int:
+        # Delete in bounded batches so a large purge never holds the write lock for long.
         now = time.time()
-        with self._lock, sqlite3.connect(self.db_path) as conn:
-            cur = conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (now,))
-            conn.commit()
-            return cur.rowcount
+        removed = 0
+        conn = self._conn()
+        while True:
+            with self._lock:
+                cur = conn.execute(
+                    """
+                    DELETE FROM cache_entries WHERE rowid IN (
+                        SELECT rowid FROM cache_entries WHERE expires_at < ? LIMIT ?
+                    )
+                    """,
+                    (now, batch_size),
+                )
+            if cur.rowcount <= 0:
+                break
+            removed += cur.rowcount
+        with self._lock:
+            conn.execute("PRAGMA optimize")
+        return removed
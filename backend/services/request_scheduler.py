@@ -1,20 +1,33 @@
 import threading
 import time
 import heapq
+import itertools
 import random
-from typing import Any, Callable, Optional, Tuple
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Most due tasks the worker takes off the heap per pass
+_MAX_BATCH = 32
+_NS_PER_SECOND = 1_000_000_000
 
 
 class RequestScheduler:
     def __init__(self):
         self._lock = threading.Lock()
-        self._condition = threading.Condition(self._lock)
-        self._queue: list[Tuple[float, int, Callable, tuple, dict, Optional[str]]] = []
-        self._inflight_keys = set()
+        # Producers append to the arrivals mailbox (deque.append is atomic) and set the
+        # wake event; only the worker thread touches the heap, so schedule() takes no lock.
+        self._arrivals: deque = deque()
+        self._wake = threading.Event()
+        self._heap: list[Tuple[int, int, int, Callable, tuple, dict, Optional[str]]] = []
+        self._seq = itertools.count()
+        # key -> owner token; setdefault/pop on a dict are atomic, so dedup needs no lock
+        self._inflight: Dict[str, object] = {}
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
     def start(self) -> None:
+        if self._running:
+            return
         with self._lock:
             if self._running:
                 return
@@ -25,7 +38,7 @@ class RequestScheduler:
     def stop(self) -> None:
         with self._lock:
             self._running = False
-            self._condition.notify_all()
+        self._wake.set()
 
     def schedule(
         self,
@@ -38,41 +51,50 @@ class RequestScheduler:
         **kwargs: Any,
     ) -> bool:
         self.start()
-        with self._lock:
-            if key and key in self._inflight_keys:
+        if key:
+            token = object()
+            if self._inflight.setdefault(key, token) is not token:
                 return False
-            run_at = time.time() + max(0.0, delay_seconds)
-            if jitter:
-                run_at += random.uniform(-jitter, jitter) * max(0.1, delay_seconds or 1.0)
-            heapq.heappush(self._queue, (run_at, priority, fn, args, kwargs, key))
-            if key:
-                self._inflight_keys.add(key)
-            self._condition.notify()
-            return True
+        # Run times are monotonic nanoseconds, immune to wall-clock adjustments.
+        delay = max(0.0, delay_seconds)
+        if jitter:
+            delay += random.uniform(-jitter, jitter) * max(0.1, delay_seconds or 1.0)
+        run_at = time.monotonic_ns() + int(delay * _NS_PER_SECOND)
+        self._arrivals.append((run_at, priority, next(self._seq), fn, args, kwargs, key))
+        self._wake.set()
+        return True
 
     def _worker(self) -> None:
+        heap = self._heap
+        arrivals = self._arrivals
         while True:
-            with self._lock:
-                if not self._running and not self._queue:
+            self._wake.clear()
+            while arrivals:
+                heapq.heappush(heap, arrivals.popleft())
+            if not heap:
+                if not self._running:
                     break
-                if not self._queue:
-                    self._condition.wait(timeout=1.0)
-                    continue
-                run_at, priority, fn, args, kwargs, key = self._queue[0]
-                now = time.time()
-                if run_at > now:
-                    self._condition.wait(timeout=min(1.0, run_at - now))
-                    continue
-                heapq.heappop(self._queue)
+                # schedule() and stop() both set the event, so idle waits need no polling timeout.
+                self._wake.wait()
+                continue
+            run_at = heap[0][0]
+            now = time.monotonic_ns()
+            if run_at > now:
+                self._wake.wait(timeout=(run_at - now) / _NS_PER_SECOND)
+                continue
+            # Take every due task (up to a cap) in one pass, then run them back to back.
+            batch = []
+            while heap and heap[0][0] <= now and len(batch) < _MAX_BATCH:
+                batch.append(heapq.heappop(heap))
 
-            try:
-                fn(*args, **kwargs)
-            except Exception as e:
-                print(f"Background task error in {getattr(fn, '__name__', 'task')}: {e}")
-            finally:
-                if key:
-                    with self._lock:
-                        self._inflight_keys.discard(key)
+            for _run_at, _priority, _seq, fn, args, kwargs, key in batch:
+                try:
+                    fn(*args, **kwargs)
+                except Exception as e:
+                    print(f"Background task error in {getattr(fn, '__name__', 'task')}: {e}")
+                finally:
+                    if key:
+                        self._inflight.pop(key, None)
 
 
 _scheduler = RequestScheduler()
@@ -1,88 +1,159 @@
+import heapq
+import os
+import sys
 import time
 import threading
-from collections import defaultdict, deque
-from typing import Any, Dict, List, Optional, Tuple
+from collections import Counter, defaultdict, deque
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_BY_COUNT = itemgetter(1)
+# Raw symbol spellings remembered by the normalization cache before it is reset
+_SYMBOL_INTERN_MAX = 4096
+
+
+def _evict_before(buckets: Dict[int, Counter], cutoff: int) -> None:
+    while buckets:
+        oldest = next(iter(buckets))
+        if oldest >= cutoff:
+            break
+        del buckets[oldest]
 
 
 class UsageAnalytics:
-    def __init__(self, max_events: int = 10000):
+    def __init__(self, max_events: int = 10000, bucket_retention_seconds: int = 86400):
         self._lock = threading.Lock()
-        self._events = deque(maxlen=max_events)  # (ts, symbol, include_param)
-        self._symbol_counts = defaultdict(int)
-        self._include_counts = defaultdict(int)
-        self._hour_counts = defaultdict(int)
-        self._last_prefetch_at = 0.0
+        self._events = deque(maxlen=max_events)  # (ts, interned symbol, include code)
+        # include_param takes few distinct values; events store a small int code instead
+        self._include_codes: Dict[str, int] = {}
+        self._include_names: List[str] = []
+        # Per-symbol request counts pre-aggregated by minute and by hour, so window
+        # queries merge a few buckets instead of scanning every event.
+        self._minute_buckets: Dict[int, Counter] = {}
+        self._hour_buckets: Dict[int, Counter] = {}
+        self._bucket_retention_minutes = max(60, bucket_retention_seconds // 60)
+        self._current_minute = 0
+        # Local hour of _current_minute; UTC offsets are whole minutes, so localtime()
+        # only needs re-evaluating when the minute rolls over.
+        self._current_local_hour = 0
+        self._symbol_counts = Counter()
+        self._total_requests = 0
+        self._include_counts = Counter()
+        self._hour_counts = Counter()
+        self._last_prefetch_at: Optional[int] = None  # monotonic ns
         self._last_seen: Dict[str, str] = {}
-        self._transitions = defaultdict(lambda: defaultdict(int))
+        self._symbol_intern: Dict[str, str] = {}
+        self._transitions: Dict[str, Counter] = defaultdict(Counter)
 
     def record(self, symbol: str, include_param: str, client_id: str | None = None) -> None:
         now = time.time()
-        symbol = symbol.upper().strip()
+        symbol = self._normalize_symbol(symbol)
         include_param = include_param.strip().lower() if include_param else "full"
         with self._lock:
-            self._events.append((now, symbol, include_param))
+            code = self._include_codes.get(include_param)
+            if code is None:
+                code = self._include_codes[include_param] = len(self._include_names)
+                self._include_names.append(include_param)
+            self._events.append((now, symbol, code))
+            self._add_to_buckets(now, symbol)
             self._symbol_counts[symbol] += 1
+            self._total_requests += 1
             self._include_counts[include_param] += 1
-            hour = time.localtime(now).tm_hour
-            self._hour_counts[hour] += 1
+            self._hour_counts[self._current_local_hour] += 1
             if client_id:
                 prev = self._last_seen.get(client_id)
                 if prev and prev != symbol:
                     self._transitions[prev][symbol] += 1
                 self._last_seen[client_id] = symbol
 
+    def _normalize_symbol(self, symbol: str) -> str:
+        # Raw -> interned normalized symbol, so repeat lookups skip upper()/strip() and
+        # every structure shares one string object per symbol.
+        normalized = self._symbol_intern.get(symbol)
+        if normalized is None:
+            if len(self._symbol_intern) >= _SYMBOL_INTERN_MAX:
+                self._symbol_intern.clear()
+            normalized = sys.intern(symbol.upper().strip())
+            self._symbol_intern[symbol] = normalized
+        return normalized
+
+    def _add_to_buckets(self, now: float, symbol: str) -> None:
+        minute = int(now // 60)
+        if minute != self._current_minute:
+            self._current_minute = minute
+            self._current_local_hour = time.localtime(now).tm_hour
+            self._evict_buckets(minute)
+        bucket = self._minute_buckets.get(minute)
+        if bucket is None:
+            bucket = self._minute_buckets[minute] = Counter()
+        bucket[symbol] += 1
+        bucket = self._hour_buckets.get(minute // 60)
+        if bucket is None:
+            bucket = self._hour_buckets[minute // 60] = Counter()
+        bucket[symbol] += 1
+
+    def _evict_buckets(self, minute: int) -> None:
+        # Buckets are created in time order, so dict order is sorted: only the stale
+        # prefix is visited instead of every bucket.
+        oldest_minute = minute - self._bucket_retention_minutes
+        _evict_before(self._minute_buckets, oldest_minute)
+        _evict_before(self._hour_buckets, oldest_minute // 60)
+
+    def _window_buckets(self, window_seconds: int, now: float) -> Iterator[Counter]:
+        """Buckets covering the last window_seconds (minute resolution); caller holds the lock."""
+        end = int(now // 60)
+        minute = end - max(1, int(window_seconds // 60)) + 1
+        while minute <= end:
+            if minute % 60 == 0 and minute + 59 <= end:
+                bucket = self._hour_buckets.get(minute // 60)
+                minute += 60
+            else:
+                bucket = self._minute_buckets.get(minute)
+                minute += 1
+            if bucket:
+                yield bucket
+
+    def _window_counts(self, window_seconds: int, now: float) -> Counter:
+        counts = Counter()
+        for bucket in self._window_buckets(window_seconds, now):
+            counts.update(bucket)
+        return counts
+
     def _top_symbols(self, window_seconds: int, limit: int) -> List[Tuple[str, int]]:
         now = time.time()
-        counts = defaultdict(int)
         with self._lock:
-            for ts, symbol, _include in self._events:
-                if (now - ts) <= window_seconds:
-                    counts[symbol] += 1
-        ranked = sorted(counts.items(), key=lambda item: item[1], reverse=True)
-        return ranked[:limit]
+            counts = self._window_counts(window_seconds, now)
+        return counts.most_common(limit)
 
     def popularity_score(self, symbol: str, window_seconds: int = 86400) -> int:
-        symbol = symbol.upper().strip()
+        symbol = self._normalize_symbol(symbol)
         now = time.time()
-        score = 0
         with self._lock:
-            for ts, sym, _include in self._events:
-                if sym != symbol:
-                    continue
-                if (now - ts) <= window_seconds:
-                    score += 1
-        return score
+            return sum(bucket.get(symbol, 0) for bucket in self._window_buckets(window_seconds, now))
 
     def ranked_by_score(self, limit: int = 10) -> List[Tuple[str, float]]:
+        # Requests in the last hour weigh 3, up to 6h weigh 2, up to 24h weigh 1:
+        # the same as counting each request once per band window it falls in.
         now = time.time()
-        scores = defaultdict(float)
         with self._lock:
-            for ts, symbol, _include in self._events:
-                age = now - ts
-                if age <= 3600:
-                    weight = 3.0
-                elif age <= 6 * 3600:
-                    weight = 2.0
-                elif age <= 24 * 3600:
-                    weight = 1.0
-                else:
-                    continue
-                scores[symbol] += weight
-        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
-        return ranked[:limit]
+            scores = self._window_counts(3600, now)
+            scores.update(self._window_counts(6 * 3600, now))
+            scores.update(self._window_counts(24 * 3600, now))
+        top = heapq.nlargest(limit, scores.items(), key=_BY_COUNT)
+        return [(symbol, float(score)) for symbol, score in top]
 
     def predict_next(self, symbol: str, top_n: int = 3) -> List[Tuple[str, int]]:
-        symbol = symbol.upper().strip()
+        symbol = self._normalize_symbol(symbol)
         with self._lock:
-            options = self._transitions.get(symbol, {})
-            ranked = sorted(options.items(), key=lambda item: item[1], reverse=True)
-            return ranked[:top_n]
+            options = list(self._transitions.get(symbol, {}).items())
+        return heapq.nlargest(top_n, options, key=_BY_COUNT)
 
     def summary(self, window_seconds: int = 86400, top_n: int = 10) -> Dict[str, Any]:
         with self._lock:
             include_counts = dict(self._include_counts)
-            hour_counts = {str(k): v for k, v in self._hour_counts.items()}
-            total_requests = sum(self._symbol_counts.values())
+            hour_counts = dict(self._hour_counts)
+            total_requests = self._total_requests
+        hour_counts = {str(k): v for k, v in hour_counts.items()}
         top_symbols = self._top_symbols(window_seconds, top_n)
         scored = self.ranked_by_score(top_n)
         return {
@@ -101,16 +172,20 @@ class UsageAnalytics:
         min_requests: int,
         interval_seconds: int,
     ) -> List[str]:
-        now = time.time()
+        now = time.monotonic_ns()
         with self._lock:
-            if (now - self._last_prefetch_at) < interval_seconds:
+            last = self._last_prefetch_at
+            if last is not None and (now - last) < interval_seconds * 1_000_000_000:
                 return []
             self._last_prefetch_at = now
         ranked = self.ranked_by_score(top_n)
         return [symbol for symbol, score in ranked if score >= min_requests]
 
 
-_analytics = UsageAnalytics()
+_analytics = UsageAnalytics(
+    max_events=int(os.getenv("USAGE_MAX_EVENTS", "10000")),
+    bucket_retention_seconds=int(os.getenv("USAGE_BUCKET_RETENTION_SECONDS", "86400")),
+)
 
 
 def record_analysis_request(symbol: str, include_param: str) -> None:
@@ -1,23 +1,34 @@
 import time
 import threading
-from collections import defaultdict, deque
-from typing import Dict
+from typing import Dict, List, Tuple
+
+_NS_PER_SECOND = 1_000_000_000
 
 
 class UserRateLimiter:
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._events: Dict[str, deque] = defaultdict(deque)
+    def __init__(self, shards: int = 64):
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        # Keys are striped across independently locked shards so unrelated clients never contend.
+        self._mask = shards - 1
+        # Per key: (tokens, last refill in monotonic ns) token bucket
+        self._shards: List[Tuple[threading.Lock, Dict[str, Tuple[float, int]]]] = [
+            (threading.Lock(), {}) for _ in range(shards)
+        ]
 
     def allow(self, key: str, limit: int, window_seconds: int) -> bool:
-        now = time.time()
-        with self._lock:
-            dq = self._events[key]
-            while dq and (now - dq[0]) > window_seconds:
-                dq.popleft()
-            if len(dq) >= limit:
+        """
+        Token bucket holding up to `limit` tokens, refilled at limit/window_seconds per second.
+        """
+        now = time.monotonic_ns()
+        lock, state = self._shards[hash(key) & self._mask]
+        with lock:
+            tokens, last = state.get(key, (limit, now))
+            tokens = min(limit, tokens + (now - last) * limit / (window_seconds * _NS_PER_SECOND))
+            if tokens < 1:
+                state[key] = (tokens, now)
                 return False
-            dq.append(now)
+            state[key] = (tokens - 1, now)
             return True
 
 
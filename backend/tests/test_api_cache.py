@@ -0,0 +1,117 @@
+import pytest
+from utils import api_resilience
+from utils.api_resilience import APICache, ShardedLRU, _make_cache_key, cached_api_call
+
+
+def test_sharded_lru_get_set():
+    cache = ShardedLRU(default_ttl=60, max_entries=32, shards=4)
+    cache.set("a", {"x": 1})
+    assert cache.get("a") == {"x": 1}
+    assert cache.get("missing") is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_sharded_lru_expiry_and_stale():
+    cache = ShardedLRU(default_ttl=60, max_entries=32, shards=4)
+    cache.set("a", 1, ttl=0)
+    assert cache.get("a", allow_stale=True) == 1
+    assert cache.get("a") is None
+    # Expired entry is dropped on a non-stale read
+    assert cache.get("a", allow_stale=True) is None
+
+
+def test_sharded_lru_evicts_least_recently_used():
+    cache = ShardedLRU(default_ttl=60, max_entries=2, shards=1)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_sharded_lru_requires_power_of_two_shards():
+    with pytest.raises(ValueError):
+        ShardedLRU(shards=3)
+
+
+def test_cache_key_is_stable_and_fixed_length():
+    class Provider:
+        pass
+
+    provider = Provider()
+    key = _make_cache_key("p:f:", (provider, "TCS"), {"b": 1, "a": 2})
+    assert key == _make_cache_key("p:f:", (provider, "TCS"), {"a": 2, "b": 1})
+    assert key != _make_cache_key("p:f:", (provider, "INFY"), {"a": 2, "b": 1})
+    assert key != _make_cache_key("p:f:", (Provider(), "TCS"), {"a": 2, "b": 1})
+    assert key.startswith("p:f:") and len(key) == len("p:f:") + 32
+
+    a = "x" * 50
+    b = "".join(["x"] * 50)
+    assert a == b and a is not b
+    assert _make_cache_key("p:f:", (a, a), {}) == _make_cache_key("p:f:", (a, b), {})
+
+
+def test_api_cache_coalesces_disk_writes(tmp_path):
+    cache = APICache(cache_dir=str(tmp_path), enable_memory=False, flush_interval=60)
+    cache.set("k", 1)
+    cache.set("k", 2)
+
+    # Pending writes are served before they reach disk.
+    assert cache.get("k") == 2
+    assert list(tmp_path.iterdir()) == []
+
+    cache.flush()
+    assert [p.name for p in tmp_path.iterdir()] == ["k.json"]
+    assert cache.get("k") == 2
+
+
+def test_cached_api_call_serves_repeat_calls_from_hot_tier(tmp_path, monkeypatch):
+    monkeypatch.setattr(api_resilience, "_api_cache", APICache(cache_dir=str(tmp_path), enable_disk=False))
+    calls = []
+
+    @cached_api_call(cache_key_prefix="test_hot", ttl=60)
+    def fetch(symbol, unhashable=None):
+        calls.append(symbol)
+        return {"symbol": symbol}
+
+    assert fetch("TCS") == {"symbol": "TCS"}
+    assert fetch("TCS") == {"symbol": "TCS"}
+    assert fetch("TCS", unhashable=[1]) == {"symbol": "TCS"}
+    assert fetch("TCS", unhashable=[1]) == {"symbol": "TCS"}
+    assert calls == ["TCS", "TCS"]
+
+    fetch.cache_clear()
+    assert fetch("TCS") == {"symbol": "TCS"}
+    assert calls == ["TCS", "TCS"]
+
+
+def test_api_cache_clear_empties_disk(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = APICache(cache_dir=str(cache_dir), flush_interval=60)
+    cache.set("k", 1)
+    cache.flush()
+    cache.clear()
+
+    assert cache.get("k") is None
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_api_cache_l1_serves_hot_keys_and_sees_updates():
+    cache = APICache(enable_disk=False)
+    cache.set("k", 1)
+    assert cache.get("k") == 1
+    assert "k" in cache._l1
+    assert cache.get("k") == 1
+
+    cache.set("k", 2)
+    assert cache.get("k") == 2
+    cache.clear()
+    assert cache.get("k") is None
+    assert cache.get_stats()["hits"] == 3
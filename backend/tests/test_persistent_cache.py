@@ -0,0 +1,145 @@
+import threading
+import time
+from services.persistent_cache import PersistentCache
+
+
+def test_set_and_get_roundtrip(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    cache.set("analysis:TEST", {"ratios": {"roe": 12.5}}, ttl=60)
+
+    value, cached_at, expires_at = cache.get("analysis:TEST")
+    assert value == {"ratios": {"roe": 12.5}}
+    assert cached_at <= time.time() < expires_at
+    assert cache.get("missing") is None
+    cache.close()
+
+
+def test_set_overwrites_existing_key(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    cache.set("k", 1, ttl=60)
+    cache.set("k", 2, ttl=60)
+    assert cache.get("k")[0] == 2
+    cache.close()
+
+
+def test_cleanup_removes_only_expired(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    cache.set("expired", 1, ttl=-10)
+    cache.set("fresh", 2, ttl=60)
+
+    assert cache.cleanup() == 1
+    assert cache.get("expired") is None
+    assert cache.get("fresh")[0] == 2
+    cache.close()
+
+
+def test_data_survives_reopen(tmp_path):
+    db_path = str(tmp_path / "cache.sqlite")
+    cache = PersistentCache(db_path)
+    cache.set("k", {"a": 1}, ttl=60)
+    cache.close()
+
+    reopened = PersistentCache(db_path)
+    assert reopened.get("k")[0] == {"a": 1}
+    reopened.close()
+
+
+def test_cleanup_in_batches(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    for i in range(25):
+        cache.set(f"expired:{i}", i, ttl=-10)
+    cache.set("fresh", 1, ttl=60)
+
+    assert cache.cleanup(batch_size=10) == 25
+    assert cache.get("fresh")[0] == 1
+    cache.close()
+
+
+def test_reads_legacy_text_rows(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    cache._conn().execute(
+        "INSERT INTO cache_entries (key, value, cached_at, expires_at) VALUES (?, ?, ?, ?)",
+        ("legacy", '{"a": [1, 2]}', time.time(), time.time() + 60),
+    )
+    assert cache.get("legacy")[0] == {"a": [1, 2]}
+    cache.close()
+
+
+def test_set_applies_ttl_jitter(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    for i in range(20):
+        cache.set(f"k:{i}", i, ttl=1000)
+    for i in range(20):
+        _value, cached_at, expires_at = cache.get(f"k:{i}")
+        assert 900 <= expires_at - cached_at <= 1100
+    cache.close()
+
+
+def test_refresh_hint_near_expiry(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    now = time.time()
+    cache._conn().execute(
+        "INSERT INTO cache_entries (key, value, cached_at, expires_at) VALUES (?, ?, ?, ?)",
+        ("old", b"1", now - 95, now + 5),
+    )
+    cache._conn().execute(
+        "INSERT INTO cache_entries (key, value, cached_at, expires_at) VALUES (?, ?, ?, ?)",
+        ("expired", b"3", now - 120, now - 20),
+    )
+    cache.set("new", 2, ttl=100)
+
+    assert cache.get_with_refresh_hint("old") == (1, now - 95, now + 5, True)
+    assert cache.get_with_refresh_hint("new")[3] is False
+    # Expired rows are left to the caller's stale handling
+    assert cache.get_with_refresh_hint("expired")[3] is False
+    assert cache.get_with_refresh_hint("missing") is None
+    cache.close()
+
+
+def test_threads_use_their_own_connections(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(20):
+                cache.set(f"t{n}:{i}", i, ttl=60)
+                assert cache.get(f"t{n}:{i}")[0] == i
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    cache.close()
+
+
+def test_short_lived_threads_do_not_leak_connections(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    cache.set("k", 1, ttl=60)
+
+    for _ in range(50):
+        t = threading.Thread(target=cache.get, args=("k",))
+        t.start()
+        t.join()
+
+    # Each finished thread's connection is closed along with its thread-local
+    assert len(cache._connections) <= 2
+    cache.close()
+    assert len(cache._connections) == 0
+
+
+def test_set_many_writes_all_entries(tmp_path):
+    cache = PersistentCache(str(tmp_path / "cache.sqlite"))
+    cache.set("a", 0, ttl=60)
+    cache.set_many([("a", 1, 60), ("b", {"x": 2}, 60), ("c", [3], 60)])
+
+    assert cache.get("a")[0] == 1
+    assert cache.get("b")[0] == {"x": 2}
+    assert cache.get("c")[0] == [3]
+    cache.set_many([])
+    cache.close()
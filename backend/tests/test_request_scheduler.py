@@ -0,0 +1,31 @@
+import threading
+import time
+
+from services.request_scheduler import RequestScheduler
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_runs_tasks_in_due_order_and_dedupes_keys():
+    scheduler = RequestScheduler()
+    ran = []
+    done = threading.Event()
+
+    scheduler.schedule(ran.append, "late", delay_seconds=0.2)
+    scheduler.schedule(ran.append, "early", delay_seconds=0.05, key="k")
+    assert not scheduler.schedule(ran.append, "duplicate", key="k")
+    scheduler.schedule(done.set, delay_seconds=0.3)
+
+    assert done.wait(2.0)
+    assert ran == ["early", "late"]
+    # The key is released once its task has run.
+    assert scheduler.schedule(ran.append, "again", key="k")
+    assert _wait_for(lambda: ran[-1] == "again")
+    scheduler.stop()
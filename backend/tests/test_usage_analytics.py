@@ -0,0 +1,51 @@
+from services.usage_analytics import UsageAnalytics
+
+
+def test_window_counts_and_popularity():
+    analytics = UsageAnalytics()
+    for symbol in ["tcs", "TCS", "INFY", "TCS", "HDFC", "INFY"]:
+        analytics.record(symbol, "full")
+
+    assert analytics._top_symbols(3600, 2) == [("TCS", 3), ("INFY", 2)]
+    assert analytics.popularity_score("tcs", 3600) == 3
+    assert analytics.popularity_score("WIPRO", 86400) == 0
+
+
+def test_ranked_by_score_weights_recent_requests():
+    analytics = UsageAnalytics()
+    for symbol in ["TCS", "TCS", "INFY"]:
+        analytics.record(symbol, "full")
+
+    # Everything is within the last hour, so each request weighs 3.
+    assert analytics.ranked_by_score(5) == [("TCS", 6.0), ("INFY", 3.0)]
+
+
+def test_window_uses_hour_buckets_for_whole_hours():
+    analytics = UsageAnalytics()
+    base = 1_700_000_000 // 3600 * 3600
+    for offset in (0, 1800, 3599, 3600 * 2 + 30):
+        ts = base + offset
+        with analytics._lock:
+            analytics._add_to_buckets(ts, "TCS")
+
+    now = base + 3600 * 2 + 60
+    with analytics._lock:
+        assert analytics._window_counts(3 * 3600, now)["TCS"] == 4
+        assert analytics._window_counts(3600, now)["TCS"] == 1
+
+
+def test_old_buckets_are_evicted():
+    analytics = UsageAnalytics(bucket_retention_seconds=3600)
+    base = 1_700_000_000 // 3600 * 3600
+    with analytics._lock:
+        analytics._add_to_buckets(base, "TCS")
+        analytics._add_to_buckets(base + 3 * 3600, "INFY")
+    assert list(analytics._minute_buckets) == [(base + 3 * 3600) // 60]
+    assert list(analytics._hour_buckets) == [(base + 3 * 3600) // 3600]
+
+
+def test_requests_before_first_read_are_counted():
+    analytics = UsageAnalytics()
+    analytics.record("TCS", "full")
+    analytics.record("TCS", "full")
+    assert analytics.popularity_score("TCS") == 2
@@ -0,0 +1,20 @@
+from services import user_rate_limiter
+from services.user_rate_limiter import UserRateLimiter
+
+
+def test_burst_up_to_limit_then_refill(monkeypatch):
+    now = [1_000_000_000_000]
+    monkeypatch.setattr(user_rate_limiter.time, "monotonic_ns", lambda: now[0])
+    limiter = UserRateLimiter()
+
+    assert [limiter.allow("k", 3, 60) for _ in range(4)] == [True, True, True, False]
+    now[0] += 20_000_000_000  # one token refills every 20s
+    assert limiter.allow("k", 3, 60)
+    assert not limiter.allow("k", 3, 60)
+
+
+def test_keys_are_independent():
+    limiter = UserRateLimiter(shards=4)
+    assert limiter.allow("a", 1, 60)
+    assert not limiter.allow("a", 1, 60)
+    assert limiter.allow("b", 1, 60)
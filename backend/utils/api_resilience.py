@@ -3,19 +3,32 @@ Advanced caching and retry mechanism for API calls
 Handles rate limiting, transient failures, and reduces redundant requests
 """
 
+import atexit
 import time
 import functools
+import hashlib
+import io
+import pickle
+import shutil
 import threading
+import uuid
 import random
+import re
 import contextvars
 from collections import deque, OrderedDict
 from contextlib import contextmanager
 from typing import Any, Callable, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-import json
 import os
+
+import orjson
+
 from utils.logging import log
 
+# Interval math uses the monotonic clock so NTP adjustments can't shift cooldowns;
+# wall-clock time is kept only where timestamps are persisted (APICache cached_at).
+_now = time.monotonic
+
 try:
     from utils.monitoring import record_rate_limit, record_circuit_open
 except Exception:
@@ -38,16 +51,19 @@ class RetryBudgetExceeded(Exception):
     """Raised when a request-level retry budget is exhausted."""
 
 
+_RATE_LIMIT_RE = re.compile(r"429|too many requests|rate limit", re.IGNORECASE)
+
+
 def is_rate_limit_error(exc: Exception) -> bool:
     """Best-effort detection for HTTP 429 or rate limiting errors."""
     try:
         status = getattr(getattr(exc, "response", None), "status_code", None)
-        if status == 429:
-            return True
     except Exception:
-        pass
-    message = str(exc).lower()
-    return "429" in message or "too many requests" in message or "rate limit" in message
+        status = None
+    if status is not None:
+        # An HTTP status is authoritative; only fall back to the message without one.
+        return status == 429
+    return _RATE_LIMIT_RE.search(str(exc)) is not None
 
 
 class RateLimiter:
@@ -63,17 +79,21 @@ class RateLimiter:
         self._last_call = 0.0
 
     def wait(self) -> None:
+        # Reserve this caller's slot under the lock, then sleep without holding it so
+        # queued callers can compute their own slots concurrently.
         with self._lock:
-            now = time.time()
+            now = _now()
             elapsed = now - self._last_call
             wait_time = self.min_interval - elapsed
+            sleep_for = 0.0
             if wait_time > 0:
                 jitter_delta = 0.0
                 if self.jitter > 0:
                     jitter_delta = random.uniform(-self.jitter, self.jitter) * self.min_interval
                 sleep_for = max(0.0, wait_time + jitter_delta)
-                time.sleep(sleep_for)
-            self._last_call = time.time()
+            self._last_call = now + sleep_for
+        if sleep_for > 0:
+            time.sleep(sleep_for)
 
 
 class RetryCoordinator:
@@ -96,21 +116,26 @@ class RetryCoordinator:
             dq.popleft()
 
     def can_retry(self, key: str) -> bool:
-        now = time.time()
+        now = _now()
         with self._lock:
-            self._prune(key, now)
-            dq = self._retry_timestamps.setdefault(key, deque())
-            return len(dq) < self.max_retries
+            dq = self._retry_timestamps.get(key)
+            if dq is None:
+                return True
+            # Timestamps are ordered, so the budget is spent only if the
+            # max_retries-th most recent retry is still inside the window.
+            return len(dq) < self.max_retries or (now - dq[-self.max_retries]) > self.window_seconds
 
     def record_retry(self, key: str) -> None:
-        now = time.time()
+        now = _now()
         with self._lock:
-            dq = self._retry_timestamps.setdefault(key, deque())
+            dq = self._retry_timestamps.get(key)
+            if dq is None:
+                dq = self._retry_timestamps[key] = deque()
             dq.append(now)
             self._prune(key, now)
 
     def set_cooldown(self, key: str, seconds: float) -> None:
-        now = time.time()
+        now = _now()
         with self._lock:
             until = now + seconds
             current = self._cooldowns.get(key, 0.0)
@@ -118,10 +143,9 @@ class RetryCoordinator:
                 self._cooldowns[key] = until
 
     def in_cooldown(self, key: str) -> bool:
-        now = time.time()
-        with self._lock:
-            until = self._cooldowns.get(key, 0.0)
-        return now < until
+        # Read without the lock: a single dict lookup is atomic, and a stale read
+        # only lets one extra call through.
+        return _now() < self._cooldowns.get(key, 0.0)
 
 
 _retry_coordinator = RetryCoordinator(max_retries=2, window_seconds=300)
@@ -144,15 +168,24 @@ class RequestBudget:
 
 
 _request_budget_var = contextvars.ContextVar("request_budget", default=None)
+# Number of request_budget() scopes currently open in any thread; while zero,
+# retry wrappers skip the context variable lookup.
+_active_budgets = 0
+_active_budgets_lock = threading.Lock()
 
 
 @contextmanager
 def request_budget(max_attempts: int = 3):
+    global _active_budgets
     budget = RequestBudget(max_attempts=max_attempts)
     token = _request_budget_var.set(budget)
+    with _active_budgets_lock:
+        _active_budgets += 1
     try:
         yield budget
     finally:
+        with _active_budgets_lock:
+            _active_budgets -= 1
         _request_budget_var.reset(token)
 
 
@@ -182,14 +215,16 @@ class CircuitBreaker:
             self._failures.popleft()
 
     def allow_request(self) -> bool:
-        now = time.time()
-        with self._lock:
-            if self._state == "OPEN":
-                if now >= self._opened_until:
-                    self._state = "HALF_OPEN"
-                    return True
-                return False
+        # Fast path reads state without the lock; only the OPEN -> HALF_OPEN
+        # transition takes it.
+        if self._state != "OPEN":
             return True
+        if _now() < self._opened_until:
+            return False
+        with self._lock:
+            if self._state == "OPEN" and _now() >= self._opened_until:
+                self._state = "HALF_OPEN"
+        return True
 
     def record_success(self) -> None:
         with self._lock:
@@ -199,14 +234,23 @@ class CircuitBreaker:
     def record_failure(self, exc: Exception) -> None:
         if not is_rate_limit_error(exc):
             return
-        now = time.time()
+        now = _now()
         with self._lock:
-            self._prune(now)
             self._failures.append(now)
-            if len(self._failures) >= self.failure_threshold:
-                self._state = "OPEN"
+            # Prune only once the deque has grown; the threshold check below looks
+            # at the failure_threshold-th most recent failure, so stale entries
+            # left in front don't affect it.
+            if len(self._failures) > self.failure_threshold * 2:
+                self._prune(now)
+            if (
+                len(self._failures) >= self.failure_threshold
+                and (now - self._failures[-self.failure_threshold]) <= self.window_seconds
+            ):
+                # Publish the deadline before the state so lock-free readers never
+                # pair OPEN with a stale deadline.
                 self._opened_until = now + self.recovery_timeout
-                log(f"🚫 Circuit OPEN for {self.name} ({self.failure_threshold} rate-limit errors)")
+                self._state = "OPEN"
+                log(f"[CIRCUIT-OPEN] Circuit OPEN for {self.name} ({self.failure_threshold} rate-limit errors)")
                 record_circuit_open(self.name)
 
     @property
@@ -220,12 +264,12 @@ class CircuitBreaker:
             self._opened_until = 0.0
 
     def status(self) -> Dict[str, Any]:
-        now = time.time()
+        now = _now()
         with self._lock:
             remaining = max(0.0, self._opened_until - now) if self._state == "OPEN" else 0.0
             return {
                 "state": self._state,
-                "opened_until": self._opened_until,
+                "opened_until": time.time() + remaining if remaining else 0.0,
                 "cooldown_remaining": round(remaining, 2),
             }
 
@@ -242,9 +286,16 @@ class APICache:
         enable_disk: bool = True,
         enable_memory: bool = True,
         max_entries: int = 5000,
+        flush_interval: float = 1.0,
     ):
-        self.memory_cache: "OrderedDict[str, tuple]" = OrderedDict()  # (value, cached_at, ttl)
+        # Plain dict in insertion order: writes re-insert at the end and eviction pops the
+        # front, while read hits skip reordering (approximate LRU).
+        self.memory_cache: Dict[str, tuple] = {}  # (value, cached_at, ttl)
+        # Small L1 of recently hit keys, read without the lock and written under it.
+        self._l1: Dict[str, tuple] = {}  # (value, cached_at, ttl)
+        self._l1_max = 64
         self.cache_dir = cache_dir
+        self._cache_dir_prefix = os.path.join(cache_dir, "")
         self.default_ttl = default_ttl
         self.enable_disk = enable_disk
         self.enable_memory = enable_memory
@@ -258,6 +309,12 @@ class APICache:
             "disk_hits": 0,
             "disk_misses": 0,
         }
+        # Disk writes are coalesced per key and written by a background flusher,
+        # keeping file I/O off the request thread.
+        self.flush_interval = flush_interval
+        self._dirty: Dict[str, tuple] = {}  # key -> (value, cached_at, ttl)
+        self._flush_cond = threading.Condition()
+        self._flusher: Optional[threading.Thread] = None
 
         if self.enable_disk:
             os.makedirs(cache_dir, exist_ok=True)
@@ -267,19 +324,25 @@ class APICache:
         now = time.time()
 
         if self.enable_memory:
+            entry = self._l1.get(key)
+            if entry is not None and (now - entry[1]) < entry[2]:
+                self.stats["hits"] += 1
+                return entry[0]
+
             with self._lock:
-                if key in self.memory_cache:
-                    value, cached_at, ttl = self.memory_cache[key]
+                entry = self.memory_cache.get(key)
+                if entry is not None:
+                    value, cached_at, ttl = entry
                     if (now - cached_at) < ttl:
                         self.stats["hits"] += 1
-                        self.memory_cache.move_to_end(key)
+                        self._promote(key, entry)
                         return value
                     if allow_stale:
                         self.stats["stale_hits"] += 1
-                        self.memory_cache.move_to_end(key)
                         return value
                     # Expired, remove it
                     del self.memory_cache[key]
+                    self._l1.pop(key, None)
 
         # Try to load from disk cache as fallback
         if self.enable_disk:
@@ -291,7 +354,7 @@ class APICache:
                 else:
                     self.stats["stale_hits"] += 1
                 if self.enable_memory:
-                    self.memory_cache[key] = (value, cached_at, ttl)
+                    self._store_in_memory(key, (value, cached_at, ttl))
                 return value
 
         self.stats["misses"] += 1
@@ -304,54 +367,114 @@ class APICache:
         effective_ttl = ttl if ttl is not None else self.default_ttl
         cached_at = time.time()
         if self.enable_memory:
-            with self._lock:
-                self.memory_cache[key] = (value, cached_at, effective_ttl)
-                self.memory_cache.move_to_end(key)
-                while len(self.memory_cache) > self.max_entries:
-                    self.memory_cache.popitem(last=False)
+            self._store_in_memory(key, (value, cached_at, effective_ttl))
         if self.enable_disk:
-            self._save_to_disk(key, value, cached_at, effective_ttl)
+            self._queue_disk_write(key, value, cached_at, effective_ttl)
         self.stats["sets"] += 1
     
+    def _promote(self, key: str, entry: tuple) -> None:
+        # Caller holds self._lock. FIFO eviction is close enough for an L1 this small.
+        l1 = self._l1
+        if key not in l1 and len(l1) >= self._l1_max:
+            del l1[next(iter(l1))]
+        l1[key] = entry
+
+    def _store_in_memory(self, key: str, entry: tuple) -> None:
+        cache = self.memory_cache
+        with self._lock:
+            cache.pop(key, None)
+            cache[key] = entry
+            if key in self._l1:
+                self._l1[key] = entry
+            while len(cache) > self.max_entries:
+                del cache[next(iter(cache))]
+
+    def _queue_disk_write(self, key: str, value: Any, cached_at: float, ttl: int) -> None:
+        with self._flush_cond:
+            self._dirty[key] = (value, cached_at, ttl)
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name="api-cache-flusher", daemon=True)
+                self._flusher.start()
+                atexit.register(self.flush)
+            self._flush_cond.notify()
+
+    def _take_dirty(self) -> Dict[str, tuple]:
+        with self._flush_cond:
+            dirty, self._dirty = self._dirty, {}
+        return dirty
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._flush_cond:
+                while not self._dirty:
+                    self._flush_cond.wait()
+            # Let a burst of writes accumulate, then write each key once.
+            time.sleep(self.flush_interval)
+            for key, (value, cached_at, ttl) in self._take_dirty().items():
+                self._save_to_disk(key, value, cached_at, ttl)
+
+    def flush(self) -> None:
+        """Write pending disk cache entries now."""
+        for key, (value, cached_at, ttl) in self._take_dirty().items():
+            self._save_to_disk(key, value, cached_at, ttl)
+
     def _load_from_disk(self, key: str, allow_stale: bool = False) -> Optional[Tuple[Any, float, int, bool]]:
         """Load from disk cache if available"""
+        with self._flush_cond:
+            pending = self._dirty.get(key)
+        if pending is not None:
+            value, cached_at, ttl = pending
+            is_fresh = (time.time() - cached_at) < ttl
+            if is_fresh or allow_stale:
+                return value, cached_at, ttl, is_fresh
+            return None
         try:
-            cache_file = os.path.join(self.cache_dir, f"{key}.json")
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
-                    payload = json.load(f)
-
+            # Open directly: a missing file is the common miss and costs one failed syscall.
+            with open(self._cache_path(key), 'rb') as f:
+                payload = orjson.loads(f.read())
+                mtime = None
                 # Backward compatibility: old format stored raw value
-                if isinstance(payload, dict) and "value" in payload and "cached_at" in payload:
-                    value = payload.get("value")
-                    cached_at = float(payload.get("cached_at"))
-                    ttl = int(payload.get("ttl", self.default_ttl))
-                else:
-                    value = payload
-                    cached_at = os.path.getmtime(cache_file)
-                    ttl = self.default_ttl
-
-                is_fresh = (time.time() - cached_at) < ttl
-                if is_fresh or allow_stale:
-                    return value, cached_at, ttl, is_fresh
+                if not (isinstance(payload, dict) and "value" in payload and "cached_at" in payload):
+                    mtime = os.fstat(f.fileno()).st_mtime
+
+            if mtime is None:
+                value = payload.get("value")
+                cached_at = float(payload.get("cached_at"))
+                ttl = int(payload.get("ttl", self.default_ttl))
+            else:
+                value = payload
+                cached_at = mtime
+                ttl = self.default_ttl
+
+            is_fresh = (time.time() - cached_at) < ttl
+            if is_fresh or allow_stale:
+                return value, cached_at, ttl, is_fresh
+        except FileNotFoundError:
+            pass
         except Exception as e:
             log(f"Disk cache read error: {e}")
         return None
+
+    def _cache_path(self, key: str) -> str:
+        return f"{self._cache_dir_prefix}{key}.json"
     
     def _save_to_disk(self, key: str, value: Any, cached_at: float, ttl: int) -> None:
         """Persist cache to disk"""
         try:
-            cache_file = os.path.join(self.cache_dir, f"{key}.json")
-            with open(cache_file, 'w') as f:
-                json.dump(
-                    {
-                        "value": value,
-                        "cached_at": cached_at,
-                        "ttl": ttl,
-                    },
-                    f,
-                    default=str,
-                )
+            cache_file = self._cache_path(key)
+            tmp_file = f"{cache_file}.tmp"
+            payload = orjson.dumps(
+                {
+                    "value": value,
+                    "cached_at": cached_at,
+                    "ttl": ttl,
+                },
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, cache_file)
         except Exception as e:
             log(f"Disk cache write error: {e}")
     
@@ -359,12 +482,26 @@ class APICache:
         """Clear all caches"""
         with self._lock:
             self.memory_cache.clear()
+            self._l1.clear()
+        with self._flush_cond:
+            self._dirty.clear()
         if self.enable_disk:
+            # Swap in an empty directory and delete the old one in the background,
+            # so clearing a large cache returns immediately.
+            trash_dir = f"{self.cache_dir}.trash.{uuid.uuid4().hex}"
             try:
-                for f in os.listdir(self.cache_dir):
-                    os.remove(os.path.join(self.cache_dir, f))
+                os.rename(self.cache_dir, trash_dir)
+                os.makedirs(self.cache_dir, exist_ok=True)
             except Exception as e:
                 log(f"Cache clear error: {e}")
+                return
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(trash_dir,),
+                kwargs={"ignore_errors": True},
+                name="api-cache-clear",
+                daemon=True,
+            ).start()
 
     def get_stats(self) -> Dict[str, Any]:
         total = self.stats["hits"] + self.stats["misses"]
@@ -377,8 +514,130 @@ class APICache:
         }
 
 
+class _LRUShard:
+    def __init__(self, max_entries: int):
+        self.lock = threading.RLock()
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()  # (value, cached_at, ttl)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.sets = 0
+
+
+class ShardedLRU:
+    """
+    Thread-safe in-memory LRU cache with TTL.
+    Keys are spread over independently locked shards so concurrent
+    lookups of different keys do not contend on a single lock.
+    """
+
+    def __init__(self, default_ttl: int = 3600, max_entries: int = 5000, shards: int = 16):
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._mask = shards - 1
+        per_shard = max(1, -(-max_entries // shards))
+        self._shards = [_LRUShard(per_shard) for _ in range(shards)]
+
+    def _shard(self, key: str) -> _LRUShard:
+        return self._shards[hash(key) & self._mask]
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """Get value if it exists and hasn't expired."""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None:
+                shard.misses += 1
+                return None
+            value, cached_at, ttl = entry
+            if (_now() - cached_at) < ttl:
+                shard.hits += 1
+                shard.entries.move_to_end(key)
+                return value
+            if allow_stale:
+                shard.stale_hits += 1
+                shard.entries.move_to_end(key)
+                return value
+            del shard.entries[key]
+            shard.misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store value with optional TTL override."""
+        effective_ttl = ttl if ttl is not None else self.default_ttl
+        shard = self._shard(key)
+        with shard.lock:
+            shard.entries[key] = (value, _now(), effective_ttl)
+            shard.entries.move_to_end(key)
+            while len(shard.entries) > shard.max_entries:
+                shard.entries.popitem(last=False)
+            shard.sets += 1
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = {"hits": 0, "misses": 0, "stale_hits": 0, "sets": 0}
+        entries = 0
+        for shard in self._shards:
+            with shard.lock:
+                stats["hits"] += shard.hits
+                stats["misses"] += shard.misses
+                stats["stale_hits"] += shard.stale_hits
+                stats["sets"] += shard.sets
+                entries += len(shard.entries)
+        total = stats["hits"] + stats["misses"]
+        hit_rate = (stats["hits"] / total) if total else 0.0
+        return {
+            **stats,
+            "hit_rate": round(hit_rate, 3),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "shards": len(self._shards),
+        }
+
+
 # Global cache instance
-_api_cache = APICache(max_entries=int(os.getenv("API_CACHE_MAX_ENTRIES", "5000")))
+_api_cache = APICache(
+    max_entries=int(os.getenv("API_CACHE_MAX_ENTRIES", "5000")),
+    flush_interval=float(os.getenv("API_CACHE_FLUSH_INTERVAL_SECONDS", "1.0")),
+)
+
+
+# Entries kept per cached_api_call function in its hashable-argument hot tier
+_HOT_CACHE_ENTRIES = 256
+
+# Argument types serialized by value into cache keys; anything else (e.g. a bound
+# provider instance) is keyed by identity, as the old str(args) key did.
+_KEY_VALUE_TYPES = (str, bytes, int, float, bool, type(None), tuple, list, dict, set, frozenset)
+
+
+class _CacheKeyPickler(pickle.Pickler):
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if isinstance(obj, _KEY_VALUE_TYPES):
+            return None
+        cls = type(obj)
+        return f"{cls.__module__}.{cls.__qualname__}@{id(obj):x}"
+
+
+def _make_cache_key(prefix: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """Fixed-length key: prefix plus a blake2b digest of the pickled call arguments."""
+    parts = (args, tuple(sorted(kwargs.items()))) if kwargs else (args,)
+    buf = io.BytesIO()
+    try:
+        pickler = _CacheKeyPickler(buf, protocol=5)
+        # No memo: repeated objects must pickle by value, not by identity
+        pickler.fast = True
+        pickler.dump(parts)
+        raw = buf.getvalue()
+    except Exception:
+        raw = repr(parts).encode("utf-8", "backslashreplace")
+    return prefix + hashlib.blake2b(raw, digest_size=16).hexdigest()
 
 
 def retry_with_backoff(
@@ -418,12 +677,13 @@ def retry_with_backoff(
             
             for attempt in range(1, max_attempts + 1):
                 try:
-                    budget = _request_budget_var.get()
-                    if budget and not budget.consume():
-                        raise RetryBudgetExceeded("Request retry budget exhausted")
+                    if _active_budgets:
+                        budget = _request_budget_var.get()
+                        if budget and not budget.consume():
+                            raise RetryBudgetExceeded("Request retry budget exhausted")
                     result = func(*args, **kwargs)
                     if attempt > 1:
-                        log(f"✅ {func.__name__} succeeded on attempt {attempt}")
+                        log(f"[RETRY-OK] {func.__name__} succeeded on attempt {attempt}")
                     return result
                 except exceptions as e:
                     last_exception = e
@@ -431,7 +691,7 @@ def retry_with_backoff(
                         cooldown = random.uniform(*rate_limit_cooldown_range)
                         if retry_key:
                             retry_state.set_cooldown(retry_key, cooldown)
-                        log(f"⛔ Rate limited {func.__name__}: cooldown {cooldown:.0f}s")
+                        log(f"[RATE-LIMIT] Rate limited {func.__name__}: cooldown {cooldown:.0f}s")
                         record_rate_limit()
                         if retry_on_rate_limit and attempt < max_attempts:
                             time.sleep(cooldown)
@@ -444,7 +704,7 @@ def retry_with_backoff(
                         if retry_key:
                             retry_state.record_retry(retry_key)
 
-                        log(f"⚠️  {func.__name__} attempt {attempt} failed: {e}")
+                        log(f"[RETRY] {func.__name__} attempt {attempt} failed: {e}")
                         jitter_delta = random.uniform(0, delay * jitter) if delay > 0 else 0
                         sleep_for = delay + jitter_delta
                         log(f"   Retrying in {sleep_for:.1f}s...")
@@ -457,7 +717,7 @@ def retry_with_backoff(
                         else:
                             delay *= backoff_factor
                     else:
-                        log(f"❌ {func.__name__} failed after {max_attempts} attempts")
+                        log(f"[FAILED] {func.__name__} failed after {max_attempts} attempts")
             
             # All attempts failed, raise last exception
             raise last_exception
@@ -487,21 +747,36 @@ def cached_api_call(
             ...
     """
     def decorator(func: Callable) -> Callable:
+        key_prefix = f"{cache_key_prefix}:{func.__name__}:"
+        hot = ShardedLRU(default_ttl=ttl, max_entries=_HOT_CACHE_ENTRIES, shards=4)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
+            # Results fetched by this process are also kept in a per-function hot tier
+            # keyed by the raw (hashable) arguments, skipping key serialization and
+            # the shared cache lock on repeat calls.
+            hot_key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            try:
+                hot_value = hot.get(hot_key)
+            except TypeError:
+                hot_key = None
+                hot_value = None
+            if hot_value is not None:
+                return hot_value
+
             # Generate cache key from function name and arguments
-            cache_key = f"{cache_key_prefix}:{func.__name__}:{str(args)}:{str(kwargs)}"
+            cache_key = _make_cache_key(key_prefix, args, kwargs)
             
             # Check cache first
             cached_value = _api_cache.get(cache_key)
             if cached_value is not None:
-                log(f"💾 Cache hit for {func.__name__}")
+                log(f"[CACHE-HIT] Cache hit for {func.__name__}")
                 return cached_value
 
             if circuit_breaker and not circuit_breaker.allow_request():
                 stale_value = _api_cache.get(cache_key, allow_stale=True)
                 if stale_value is not None:
-                    log(f"⚠️  Circuit OPEN for {func.__name__}, serving stale cache")
+                    log(f"[CIRCUIT-OPEN] Circuit OPEN for {func.__name__}, serving stale cache")
                     return stale_value
                 raise CircuitOpenError(f"Circuit open for {func.__name__}")
             
@@ -512,20 +787,23 @@ def cached_api_call(
                     circuit_breaker.record_success()
                 if result:  # Only cache non-empty results
                     _api_cache.set(cache_key, result, ttl)
+                    if hot_key is not None:
+                        hot.set(hot_key, result)
                 return result
             except Exception as e:
                 if circuit_breaker:
                     circuit_breaker.record_failure(e)
-                log(f"❌ API call failed: {e}")
+                log(f"[FAILED] API call failed: {e}")
                 # Try to return stale cache if allowed
                 if allow_stale_on_error:
                     # Bypass TTL check for stale data
                     stale_value = _api_cache.get(cache_key, allow_stale=True)
                     if stale_value is not None:
-                        log(f"⚠️  Returning stale cache for {func.__name__}")
+                        log(f"[STALE] Returning stale cache for {func.__name__}")
                         return stale_value
                 raise
-        
+
+        wrapper.cache_clear = hot.clear
         return wrapper
     return decorator
 
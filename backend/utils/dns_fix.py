@@ -1,10 +1,23 @@
 import os
 import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, List, Tuple
 
 import dns.resolver
 from utils.logging import log
 
+_CACHE_MAX_ENTRIES = 256
+# Failed or empty lookups are remembered briefly so outages don't hammer the nameservers.
+_NEGATIVE_TTL = 30.0
+
+_RDTYPES = ("A", "AAAA")
+_RDTYPE_AF = {"A": socket.AF_INET, "AAAA": socket.AF_INET6}
+_STREAM = socket.SOCK_STREAM
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dns-fallback")
+
 
 def _parse_nameservers(value: str) -> List[str]:
     return [part.strip() for part in value.split(",") if part.strip()]
@@ -16,13 +29,34 @@ class DNSResolver:
         self.resolver.nameservers = list(nameservers) or ["8.8.8.8", "1.1.1.1"]
         self.resolver.timeout = 3
         self.resolver.lifetime = 3
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[List[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
 
     def resolve(self, host: str, rdtype: str) -> List[str]:
+        key = (host, rdtype)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if now < entry[1]:
+                    self._cache.move_to_end(key)
+                    return entry[0]
+                del self._cache[key]
+
         try:
             answer = self.resolver.resolve(host, rdtype)
-            return [str(rdata) for rdata in answer]
+            ips = [str(rdata) for rdata in answer]
+            ttl = answer.rrset.ttl if ips else _NEGATIVE_TTL
         except Exception:
-            return []
+            ips = []
+            ttl = _NEGATIVE_TTL
+
+        with self._lock:
+            self._cache[key] = (ips, now + ttl)
+            self._cache.move_to_end(key)
+            while len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return ips
 
 
 def apply_dns_patch() -> None:
@@ -43,12 +77,13 @@ def apply_dns_patch() -> None:
             return original_getaddrinfo(host, port, family, type, proto, flags)
         except socket.gaierror as exc:
             log(f"[Trendova Hub] DNS patch: fallback resolution for {host} ({exc})")
-            result = []
-            for rdtype in ("A", "AAAA"):
-                for ip in resolver.resolve(host, rdtype):
-                    addr_family = socket.AF_INET6 if rdtype == "AAAA" else socket.AF_INET
-                    sockaddr = (ip, port)
-                    result.append((addr_family, socket.SOCK_STREAM, proto, "", sockaddr))
+            # The A and AAAA lookups are independent, so issue them concurrently.
+            futures = [(rdtype, _executor.submit(resolver.resolve, host, rdtype)) for rdtype in _RDTYPES]
+            result = [
+                (_RDTYPE_AF[rdtype], _STREAM, proto, "", (ip, port))
+                for rdtype, future in futures
+                for ip in future.result()
+            ]
             if result:
                 return result
             raise
@@ -1,8 +1,26 @@
+import atexit
+import logging
 import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 
 
 BRAND_NAME = os.getenv("BRAND_NAME", "Trendova Hub")
 
+# Records are handed to a background listener so callers never block on stdout.
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(logging.Formatter(f"[{BRAND_NAME.replace('%', '%%')}] %(message)s"))
+_listener = QueueListener(_queue, _stream_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+_logger = logging.getLogger("trendova")
+_logger.setLevel(logging.INFO)
+_logger.addHandler(QueueHandler(_queue))
+_logger.propagate = False
+
 
 def log(message: str) -> None:
-    print(f"[{BRAND_NAME}] {message}")
+    _logger.info(message)
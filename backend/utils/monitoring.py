@@ -1,65 +1,93 @@
+import bisect
+import heapq
 import time
 import threading
 from collections import defaultdict, deque
 from typing import Any, Dict, Optional
 
 
+class _MetricsShard:
+    def __init__(self, max_events: int, max_timings: int):
+        self.lock = threading.Lock()
+        self.counters = defaultdict(int)
+        self.events = defaultdict(lambda: deque(maxlen=max_events))
+        self.timings = defaultdict(lambda: deque(maxlen=max_timings))
+        self.gauges: Dict[str, Any] = {}
+
+
 class MetricsStore:
-    def __init__(self, max_events: int = 5000, max_timings: int = 500):
-        self._lock = threading.Lock()
-        self._counters = defaultdict(int)
-        self._events = defaultdict(lambda: deque(maxlen=max_events))
-        self._timings = defaultdict(lambda: deque(maxlen=max_timings))
-        self._gauges: Dict[str, Any] = {}
+    def __init__(self, max_events: int = 5000, max_timings: int = 500, shards: int = 16):
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        # Each metric key lives in one independently locked shard, so hot counters
+        # updated on every request do not serialize on a single mutex.
+        self._mask = shards - 1
+        self._shards = [_MetricsShard(max_events, max_timings) for _ in range(shards)]
+
+    def _shard(self, key: str) -> _MetricsShard:
+        return self._shards[hash(key) & self._mask]
 
     def inc(self, key: str, amount: int = 1, record_event: bool = False) -> None:
-        now = time.time()
-        with self._lock:
-            self._counters[key] += amount
+        now = time.monotonic()
+        shard = self._shard(key)
+        with shard.lock:
+            shard.counters[key] += amount
             if record_event:
-                self._events[key].append(now)
+                shard.events[key].append(now)
 
     def observe(self, key: str, value: float) -> None:
-        with self._lock:
-            self._timings[key].append(value)
+        shard = self._shard(key)
+        with shard.lock:
+            shard.timings[key].append(value)
 
     def set_gauge(self, key: str, value: Any) -> None:
-        with self._lock:
-            self._gauges[key] = value
-
-    def _rate(self, key: str, window: int) -> int:
-        now = time.time()
-        dq = self._events.get(key)
-        if not dq:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.gauges[key] = value
+
+    @staticmethod
+    def _rate(events: Dict[str, list], key: str, window: int, now: float) -> int:
+        # Event timestamps are appended in time order, so the in-window suffix starts
+        # at the first timestamp >= now - window.
+        timestamps = events.get(key)
+        if not timestamps:
             return 0
-        return sum(1 for ts in dq if (now - ts) <= window)
+        return len(timestamps) - bisect.bisect_left(timestamps, now - window)
 
     def snapshot(self) -> Dict[str, Any]:
-        with self._lock:
-            counters = dict(self._counters)
-            gauges = dict(self._gauges)
-            timings = {k: list(v) for k, v in self._timings.items()}
-            events = {k: list(v) for k, v in self._events.items()}
+        counters: Dict[str, int] = {}
+        gauges: Dict[str, Any] = {}
+        timings: Dict[str, list] = {}
+        events: Dict[str, list] = {}
+        for shard in self._shards:
+            with shard.lock:
+                counters.update(shard.counters)
+                gauges.update(shard.gauges)
+                timings.update((k, list(v)) for k, v in shard.timings.items())
+                events.update((k, list(v)) for k, v in shard.events.items())
 
         timing_stats: Dict[str, Dict[str, Optional[float]]] = {}
         for key, values in timings.items():
             if not values:
                 timing_stats[key] = {"avg": None, "p95": None, "max": None}
                 continue
-            sorted_vals = sorted(values)
-            count = len(sorted_vals)
+            count = len(values)
             p95_index = int(round(0.95 * (count - 1)))
+            # Only the values at or above p95 need ordering; nlargest selects them
+            # without sorting the whole window.
+            top = heapq.nlargest(count - p95_index, values)
             timing_stats[key] = {
-                "avg": round(sum(sorted_vals) / count, 2),
-                "p95": round(sorted_vals[p95_index], 2),
-                "max": round(sorted_vals[-1], 2),
+                "avg": round(sum(values) / count, 2),
+                "p95": round(top[-1], 2),
+                "max": round(top[0], 2),
             }
 
+        now = time.monotonic()
         rates = {
-            "requests_per_min": self._rate("requests_total", 60),
-            "requests_per_hour": self._rate("requests_total", 3600),
-            "screener_calls_per_min": self._rate("screener_calls_total", 60),
-            "screener_calls_per_hour": self._rate("screener_calls_total", 3600),
+            "requests_per_min": self._rate(events, "requests_total", 60, now),
+            "requests_per_hour": self._rate(events, "requests_total", 3600, now),
+            "screener_calls_per_min": self._rate(events, "screener_calls_total", 60, now),
+            "screener_calls_per_hour": self._rate(events, "screener_calls_total", 3600, now),
         }
 
         return {
@@ -2,157 +2,367 @@
 Scrape a stock using ScreenerProvider and dump raw data to CSV files
 for manual data integrity verification.
 
-Usage: python data_int_test/scrape_test.py TATAPOWER
+Usage: python data_int_test/scrape_test.py TATAPOWER [SYMBOL ...] [--format parquet] [--gzip]
 """
 
+import argparse
 import sys
 import os
 import csv
+import gzip
 import json
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
 
 # Add backend to path so we can import the provider
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
 
+# Cache screener.in responses between runs when requests-cache is available.
+# install_cache() patches requests globally, so it must run before the provider import.
+try:
+    import requests_cache
+
+    requests_cache.install_cache(
+        os.path.join(tempfile.gettempdir(), "scrape_test_cache"),
+        backend="sqlite",
+        expire_after=3600,
+    )
+except ImportError:
+    pass
+
 from providers.screener_provider import ScreenerProvider
 
+# Large write buffers keep each output file down to a handful of write() calls
+_BUFFER_SIZE = 1 << 20
+
+# Tables made only of these cell types (plus None) skip csv.writer
+_PLAIN_NUMBERS = (int, float)
+_NEEDS_QUOTING = re.compile(r'[",\r\n]')
+
+# Output files are written concurrently; keep their progress lines from interleaving.
+_print_lock = threading.Lock()
+
+
+def _log(message):
+    with _print_lock:
+        print(message)
+
+
+def _plain_csv(header, rows):
+    """
+    Render rows of (label, number-or-None, ...) straight to CSV text, matching
+    csv.writer's output. Returns None if any cell would need csv quoting.
+    """
+    if any(_NEEDS_QUOTING.search(cell) for cell in header):
+        return None
+    lines = [",".join(header)]
+    for label, *values in rows:
+        if type(label) is not str or _NEEDS_QUOTING.search(label):
+            return None
+        if not all(val is None or type(val) in _PLAIN_NUMBERS for val in values):
+            return None
+        lines.append(",".join([label, *["" if val is None else repr(val) for val in values]]))
+    lines.append("")
+    return "\r\n".join(lines)
+
+
+def _dump_csv(output_path, header, rows):
+    """
+    Write header plus rows to output_path through one buffered file and writer.
+    rows may be a generator, in which case it is streamed through csv.writer.
+    """
+    if output_path.endswith(".gz"):
+        # Level 1 keeps compression close to I/O speed
+        f = gzip.open(output_path, "wt", newline="", encoding="utf-8", compresslevel=1)
+    else:
+        f = open(output_path, "w", newline="", encoding="utf-8", buffering=_BUFFER_SIZE)
+    with f:
+        text = _plain_csv(header, rows) if isinstance(rows, list) else None
+        if text is not None:
+            f.write(text)
+            return
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
 
 def write_key_ratios_csv(ratios, output_path):
     """Write key ratios to CSV."""
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Metric", "Value"])
-        for key, val in sorted(ratios.items()):
-            writer.writerow([key, val])
-    print(f"  Written: {output_path} ({len(ratios)} metrics)")
+    _dump_csv(output_path, ["Metric", "Value"], sorted(ratios.items()))
+    _log(f"  Written: {output_path} ({len(ratios)} metrics)")
 
 
 def write_financials_csv(dated_dict, output_path, statement_name):
     """Write a financial statement (income/balance/cashflow) to CSV."""
     if not dated_dict:
-        print(f"  Skipped: {output_path} (no {statement_name} data)")
+        _log(f"  Skipped: {output_path} (no {statement_name} data)")
         return
 
-    # Collect all field names and sort dates
-    all_fields = set()
-    for period_data in dated_dict.values():
-        all_fields.update(period_data.keys())
+    # The provider usually inserts periods in date order already
+    dates = list(dated_dict)
+    sorted_dates = dates if all(a <= b for a, b in zip(dates, dates[1:])) else sorted(dates)
 
-    sorted_dates = sorted(dated_dict.keys())
-    sorted_fields = sorted(all_fields)
+    periods = list(dated_dict.values())
+    first_keys = periods[0].keys()
+    if all(period_data.keys() == first_keys for period_data in periods):
+        # Dense: every period shares one schema, so read each row across the period dicts
+        sorted_fields = sorted(first_keys)
+        # Every sorted date came from dated_dict, so its period dict can be fetched once
+        date_maps = [dated_dict[period] for period in sorted_dates]
+        rows = [[field] + [period_data.get(field) for period_data in date_maps] for field in sorted_fields]
+    else:
+        # Sparse: index values by field so each row only walks the periods that have it
+        by_field = {}
+        for period, period_data in dated_dict.items():
+            for field, val in period_data.items():
+                by_field.setdefault(field, {})[period] = val
+        sorted_fields = sorted(by_field)
+        rows = [[field, *map(by_field[field].get, sorted_dates)] for field in sorted_fields]
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Field"] + sorted_dates)
-        for field in sorted_fields:
-            row = [field]
-            for date in sorted_dates:
-                val = dated_dict.get(date, {}).get(field)
-                row.append(val if val is not None else "")
-            writer.writerow(row)
+    _dump_csv(output_path, ["Field"] + sorted_dates, rows)
 
-    print(f"  Written: {output_path} ({len(sorted_fields)} fields x {len(sorted_dates)} periods)")
+    _log(f"  Written: {output_path} ({len(sorted_fields)} fields x {len(sorted_dates)} periods)")
 
 
 def write_shareholding_csv(shareholding, output_path):
     """Write shareholding pattern to CSV."""
     if not shareholding:
-        print(f"  Skipped: {output_path} (no shareholding data)")
+        _log(f"  Skipped: {output_path} (no shareholding data)")
         return
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Category", "Value"])
-        for key, val in sorted(shareholding.items()):
-            writer.writerow([key, val])
-    print(f"  Written: {output_path} ({len(shareholding)} fields)")
+    _dump_csv(output_path, ["Category", "Value"], sorted(shareholding.items()))
+    _log(f"  Written: {output_path} ({len(shareholding)} fields)")
 
 
-def write_profile_csv(data, output_path):
-    """Write profile and metadata to CSV."""
-    rows = [
-        ("Name", data.get("name")),
-        ("Description", data.get("description")),
-        ("Current Price", data.get("current_price")),
-        ("Confidence Score", data.get("confidence")),
-        ("Source URL", data.get("source_url")),
-        ("Scraper Version", data.get("scraper_version")),
-        ("Scraped At", data.get("scraped_at")),
-        ("Sections Found", ", ".join(data.get("sections_found", []))),
-    ]
-    # Add company details
-    for k, v in data.get("company_details", {}).items():
-        rows.append((f"Detail: {k}", v))
-
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["Field", "Value"])
-        for row in rows:
-            writer.writerow(row)
-    print(f"  Written: {output_path} ({len(rows)} fields)")
+def _parquet_safe(df):
+    # Parquet columns need one type; stringify the values of mixed-type columns
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].map(lambda val: val if val is None else str(val))
+    return df
 
 
-def main():
-    symbol = sys.argv[1] if len(sys.argv) > 1 else "TATAPOWER"
-    output_dir = os.path.dirname(os.path.abspath(__file__))
+def write_financials_parquet(dated_dict, output_path, statement_name):
+    """Write a financial statement to Parquet, one row per period."""
+    if not dated_dict:
+        _log(f"  Skipped: {output_path} (no {statement_name} data)")
+        return
 
-    print(f"Scraping {symbol} from screener.in...")
-    provider = ScreenerProvider()
+    df = _parquet_safe(pd.DataFrame(dated_dict).T.sort_index().infer_objects())
+    df.index.name = "Period"
+    df.to_parquet(output_path, compression="snappy")
+    _log(f"  Written: {output_path} ({df.shape[1]} fields x {df.shape[0]} periods)")
+
+
+def _write_values_parquet(values, output_path, index_name):
+    df = _parquet_safe(pd.Series(values, name="Value").sort_index().to_frame())
+    df.index.name = index_name
+    df.to_parquet(output_path, compression="snappy")
+
+
+def write_key_ratios_parquet(ratios, output_path):
+    """Write key ratios to Parquet."""
+    _write_values_parquet(ratios, output_path, "Metric")
+    _log(f"  Written: {output_path} ({len(ratios)} metrics)")
+
+
+def write_shareholding_parquet(shareholding, output_path):
+    """Write shareholding pattern to Parquet."""
+    if not shareholding:
+        _log(f"  Skipped: {output_path} (no shareholding data)")
+        return
+
+    _write_values_parquet(shareholding, output_path, "Category")
+    _log(f"  Written: {output_path} ({len(shareholding)} fields)")
+
+
+def write_profile_csv(data, output_path, sections=None):
+    """Write profile and metadata to CSV."""
+    if sections is None:
+        sections = data.get("sections_found", [])
+    details = data.get("company_details", {})
+
+    def iter_rows():
+        nonlocal count
+        yield ("Name", data.get("name"))
+        yield ("Description", data.get("description"))
+        yield ("Current Price", data.get("current_price"))
+        yield ("Confidence Score", data.get("confidence"))
+        yield ("Source URL", data.get("source_url"))
+        yield ("Scraper Version", data.get("scraper_version"))
+        yield ("Scraped At", data.get("scraped_at"))
+        count += 7  # fixed rows above
+        # One row per section keeps the list parseable (grep "^Section,")
+        for section in sections:
+            count += 1
+            yield ("Section", section)
+        # Add company details
+        for k, v in details.items():
+            count += 1
+            yield (f"Detail: {k}", v)
+
+    count = 0
+    _dump_csv(output_path, ["Field", "Value"], iter_rows())
+    _log(f"  Written: {output_path} ({count} fields)")
+
+
+def _json_default(obj):
+    # Only reached for types the encoder can't handle itself; orjson already
+    # writes datetimes natively in ISO form, so match that for the stdlib fallback.
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def write_raw_json(data, output_path):
+    """Write the full scraped payload as JSON."""
+    if orjson is not None:
+        # One encode pass, then raw write() calls on the fd with no file object in between
+        payload = memoryview(orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            written = 0
+            while written < len(payload):
+                written += os.write(fd, payload[written:])
+        finally:
+            os.close(fd)
+    else:
+        with open(output_path, "wb", buffering=_BUFFER_SIZE) as f:
+            # Stream the stdlib encoder's chunks instead of building one large string
+            for chunk in json.JSONEncoder(indent=2, default=_json_default).iterencode(data):
+                f.write(chunk.encode("utf-8"))
+    _log(f"  Written: {output_path} (full raw data)")
+
+
+def process_symbol(symbol, provider, output_dir, write_pool, fmt="csv", compress=False):
+    """Scrape one symbol and queue its output files on write_pool; returns the write futures."""
+    # Tables can go to Parquet; the profile stays CSV for reading by eye.
+    if fmt == "parquet":
+        ext = "parquet"
+        write_statement = write_financials_parquet
+        write_key_ratios = write_key_ratios_parquet
+        write_shareholding = write_shareholding_parquet
+    else:
+        ext = "csv"
+        write_statement = write_financials_csv
+        write_key_ratios = write_key_ratios_csv
+        write_shareholding = write_shareholding_csv
+
+    prefix = os.path.join(output_dir, f"{symbol}_")
+
+    def path_for(name, suffix=ext):
+        if compress and suffix == "csv":
+            suffix = "csv.gz"
+        return f"{prefix}{name}.{suffix}"
+
+    _log(f"Scraping {symbol} from screener.in...")
     data = provider.get_full_data(symbol)
 
-    print(f"\nConfidence score: {data.get('confidence')}/100")
-    print(f"Sections found: {data.get('sections_found')}")
-    print(f"\nGenerating CSV files in {output_dir}/\n")
+    confidence = data.get("confidence")
+    sections = data.get("sections_found", [])
+    financials = data.get("financials", {})
+
+    _log(
+        f"\n[{symbol}] Confidence score: {confidence}/100\n"
+        f"[{symbol}] Sections found: {sections}\n"
+        f"[{symbol}] Generating CSV files in {output_dir}/\n"
+    )
+
+    # 0. Full raw JSON dump for reference. It is the largest job, so start it
+    # first and let the CSV writes overlap its encoding.
+    futures = [write_pool.submit(write_raw_json, data, path_for("raw_dump", "json"))]
 
     # 1. Profile & metadata
-    write_profile_csv(data, os.path.join(output_dir, f"{symbol}_profile.csv"))
+    futures.append(write_pool.submit(write_profile_csv, data, path_for("profile", "csv"), sections))
 
     # 2. Key ratios
-    write_key_ratios_csv(
+    futures.append(write_pool.submit(
+        write_key_ratios,
         data.get("key_ratios", {}),
-        os.path.join(output_dir, f"{symbol}_key_ratios.csv"),
-    )
+        path_for("key_ratios"),
+    ))
 
     # 3. Financial statements
-    financials = data.get("financials", {})
-
-    write_financials_csv(
+    futures.append(write_pool.submit(
+        write_statement,
         financials.get("income_statement", {}),
-        os.path.join(output_dir, f"{symbol}_income_statement.csv"),
+        path_for("income_statement"),
         "Income Statement",
-    )
+    ))
 
-    write_financials_csv(
+    futures.append(write_pool.submit(
+        write_statement,
         financials.get("balance_sheet", {}),
-        os.path.join(output_dir, f"{symbol}_balance_sheet.csv"),
+        path_for("balance_sheet"),
         "Balance Sheet",
-    )
+    ))
 
-    write_financials_csv(
+    futures.append(write_pool.submit(
+        write_statement,
         financials.get("cashflow", {}),
-        os.path.join(output_dir, f"{symbol}_cashflow.csv"),
+        path_for("cashflow"),
         "Cash Flow",
-    )
+    ))
 
     # 4. Ratios table
-    write_financials_csv(
+    futures.append(write_pool.submit(
+        write_statement,
         financials.get("ratios_table", {}),
-        os.path.join(output_dir, f"{symbol}_ratios_table.csv"),
+        path_for("ratios_table"),
         "Ratios Table",
-    )
+    ))
 
     # 5. Shareholding pattern
-    write_shareholding_csv(
+    futures.append(write_pool.submit(
+        write_shareholding,
         data.get("shareholding", {}),
-        os.path.join(output_dir, f"{symbol}_shareholding.csv"),
-    )
+        path_for("shareholding"),
+    ))
+
+    return futures
+
 
-    # 6. Full raw JSON dump for reference
-    json_path = os.path.join(output_dir, f"{symbol}_raw_dump.json")
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
-    print(f"  Written: {json_path} (full raw data)")
+def main():
+    parser = argparse.ArgumentParser(description="Scrape stocks from screener.in and dump the raw data.")
+    parser.add_argument("symbols", nargs="*", default=["TATAPOWER"])
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv", help="output format for tables")
+    parser.add_argument("--gzip", action="store_true", help="gzip CSV outputs (written as .csv.gz)")
+    args = parser.parse_args()
+    if args.format == "parquet" and pd is None:
+        parser.error("--format parquet requires pandas and pyarrow")
+
+    symbols = args.symbols
+    # SCRAPE_TEST_OUTPUT_DIR can point runs at e.g. /dev/shm instead of the repo
+    output_dir = os.getenv("SCRAPE_TEST_OUTPUT_DIR") or os.path.dirname(os.path.abspath(__file__))
+    os.makedirs(output_dir, exist_ok=True)
+    provider = ScreenerProvider()
 
-    print(f"\nDone! All files for {symbol} are in {output_dir}/")
+    # Scraping is network-bound, so symbols are fetched in parallel. Writes go to
+    # a separate pool, letting each scrape worker move on to its next symbol
+    # while the previous symbol's files are still being written.
+    with ThreadPoolExecutor(max_workers=8) as write_pool:
+        with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as scrape_pool:
+            scrapes = [
+                scrape_pool.submit(process_symbol, symbol, provider, output_dir, write_pool, args.format, args.gzip)
+                for symbol in symbols
+            ]
+        for symbol, scrape in zip(symbols, scrapes):
+            # Re-raise the first scrape or write error, if any
+            for future in scrape.result():
+                future.result()
+            _log(f"\nDone! All files for {symbol} are in {output_dir}/")
 
 
 if __name__ == "__main__":